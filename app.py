@@ -1,25 +1,94 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from ranking_engine_ttt import TTTRankingEngine
 from points_engine_db import PointsEngineDB
-from db_service import DatabaseService
+from db_service import DatabaseService, normalize_season
 from database import engine as db_engine
+from process_tournament_data import process_tournament_data
+from views import (
+    event_points,
+    fsi_trends,
+    player_top_tournaments,
+    season_standings,
+    system_parameters,
+    tier_prediction,
+    tournament_sequence,
+)
+from sqlalchemy import text
+import datetime
+import gzip
 import io
 import hashlib
+import logging
+import os
 import pathlib
+import re
+import types
 
 st.set_page_config(page_title="NCA Ranking System", layout="wide", initial_sidebar_state="expanded")
 
+logger = logging.getLogger(__name__)
+
 # Path to data directory
 _THIS_DIR = pathlib.Path(__file__).parent.resolve()
 _DATA_DIR = _THIS_DIR / 'data'
 _HASH_FILE = _THIS_DIR / '.data_hash'
 
 
+# Static SQL, built once at import. SQLAlchemy caches the compiled form of these
+# text() objects, and the plain strings (run on the raw sqlite3 cursor) stay
+# byte-identical so sqlite3's per-connection statement cache is reused.
+_SNAPSHOT_STATS_SQL = text("""
+    SELECT
+        COUNT(*) as player_count,
+        MAX(updated_at) as last_update,
+        (SELECT COUNT(*) FROM tournaments) as tournament_count
+    FROM players
+""")
+_ACTIVE_RATING_MODE_SQL = text("SELECT rating_mode FROM system_parameters WHERE is_active = 1 LIMIT 1")
+_Z_SCORE_BASELINE_SQL = text("SELECT z_score_baseline_mean, z_score_baseline_std FROM system_parameters WHERE is_active = 1 LIMIT 1")
+# Cast to integer for proper numeric sorting (16 before 9)
+_ALL_SEASONS_SQL = text("SELECT DISTINCT season FROM tournaments ORDER BY CAST(season AS INTEGER) DESC")
+_TOURNAMENT_GROUPS_SQL = text("SELECT DISTINCT tournament_group FROM tournaments WHERE tournament_group IS NOT NULL ORDER BY tournament_group")
+
+_PLAYERS_WITH_POINTS_SQL = """
+    SELECT DISTINCT p.id, p.name
+    FROM players p
+    JOIN season_event_points sep ON p.id = sep.player_id
+    ORDER BY p.name
+"""
+_TEAM_INFO_SQL = """
+    SELECT tr.player_id, tr.team_key, p.name as player_name
+    FROM tournament_results tr
+    JOIN players p ON tr.player_id = p.id
+    WHERE tr.tournament_id = :tournament_id
+    ORDER BY tr.place, p.name
+"""
+_POINTS_BY_PLACE_SQL = """
+    SELECT 
+        t.id as tournament_id,
+        t.event_name,
+        t.season,
+        t.tournament_format,
+        t.tournament_group,
+        t.tournament_date,
+        sep.place,
+        sep.total_points,
+        sep.field_size,
+        tf.fsi
+    FROM season_event_points sep
+    JOIN tournaments t ON sep.tournament_id = t.id
+    JOIN tournament_fsi tf ON sep.tournament_id = tf.tournament_id
+    WHERE t.tournament_group IS :tournament_group
+    ORDER BY t.tournament_date DESC, t.id, sep.place
+"""
+
+
 # Data version - increment this when JSON data is updated to force reload
-DATA_VERSION = "2024-12-13-v6"  # Update this when you push new data
+DATA_VERSION = "2024-12-13-v7"  # Update this when you push new data
 
 
 def get_data_version_file() -> pathlib.Path:
@@ -55,34 +124,204 @@ def load_initial_data():
     """
     return pd.DataFrame()
 
-@st.cache_data
+@st.cache_resource
+def get_engine():
+    """
+    Shared pooled SQLAlchemy engine for all query helpers.
+    
+    Held as a cache resource so every session and rerun checks connections out
+    of the same pool instead of touching module state directly.
+    """
+    return db_engine
+
+def _read_sql_raw(sql, params=None):
+    """
+    Run a read-only query on the raw DBAPI connection and build the DataFrame
+    straight from the fetched tuples, skipping SQLAlchemy's per-row Result objects.
+    
+    Args:
+        sql: SQL string using named ``:param`` placeholders
+        params: Optional dict of bind parameters
+    """
+    # sqlite3 cannot bind numpy scalars (e.g. ids taken from a DataFrame row)
+    params = {k: (v.item() if hasattr(v, 'item') else v) for k, v in (params or {}).items()}
+    
+    raw_conn = get_engine().raw_connection()
+    try:
+        cursor = raw_conn.cursor()
+        try:
+            cursor.execute(sql, params)
+            columns = [col[0] for col in cursor.description]
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+    finally:
+        raw_conn.close()
+    df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+    return _narrow_ints(_use_arrow_strings(df))
+
+def _narrow_ints(df):
+    """
+    Store int64 columns (ids, places, field sizes, counts) as int32 when every
+    value fits, halving their size in cached frames. Floats stay float64, since
+    ratings and points are still computed on after loading.
+    """
+    info = np.iinfo(np.int32)
+    narrow = {
+        col: 'int32' for col in df.select_dtypes(include='int64').columns
+        if len(df) == 0 or (df[col].min() >= info.min and df[col].max() <= info.max)
+    }
+    return df.astype(narrow) if narrow else df
+
+def _use_arrow_strings(df):
+    """
+    Store text columns (player, event_name, tournament_group, ...) as Arrow-backed
+    strings instead of Python objects: smaller cached frames and faster sort/group.
+    
+    Columns containing NULLs are left as object so existing truthiness checks
+    never see pd.NA. Zero-row results are returned untouched: every column of an
+    empty frame is object, numeric ones included, so there is nothing to infer from.
+    """
+    if len(df) == 0:
+        return df
+    for col in df.columns:
+        series = df[col]
+        # Only all-str columns; newer pandas already infers these as Arrow strings
+        if series.dtype == object and pd.api.types.infer_dtype(series, skipna=False) == 'string':
+            try:
+                df[col] = series.astype("string[pyarrow]")
+            except (ImportError, TypeError, ValueError):
+                pass  # pyarrow unavailable or non-string values
+    return df
+
+def _shrink_for_display(df):
+    """
+    Downcast float64/int64 columns to float32/int32 before a table goes to
+    st.dataframe. Values are already rounded for display, so the narrower types
+    halve the Arrow payload sent to the browser without a visible change.
+    """
+    narrow = {col: 'float32' for col in df.select_dtypes(include='float64').columns}
+    narrow.update({col: 'int32' for col in df.select_dtypes(include='int64').columns})
+    return df.astype(narrow) if narrow else df
+
+def _to_csv_bytes(df):
+    """Serialize a DataFrame to UTF-8 CSV bytes in one pass, without an intermediate str."""
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding='utf-8', lineterminator='\n')
+    return buf.getvalue()
+
+def _gzip_bytes(data):
+    """Gzip export bytes for download; level 1 keeps most of the size win at a fraction of the CPU."""
+    return gzip.compress(data, compresslevel=1)
+
+def _build_where(filters):
+    """
+    Build a parameterized WHERE clause from (column, value) pairs, skipping
+    filters whose value is empty. Bind names come from the column name
+    (e.g. 't.season' binds ':season').
+    
+    Returns:
+        Tuple of (where_sql, params)
+    """
+    clauses = []
+    params = {}
+    for column, value in filters:
+        if not value:
+            continue
+        name = column.split('.')[-1]
+        clauses.append(f"{column} = :{name}")
+        params[name] = value
+    
+    where_sql = "WHERE " + " AND ".join(clauses) if clauses else ""
+    return where_sql, params
+
+@st.cache_data(ttl=10)
+def _get_db_snapshot():
+    """
+    Fetch everything the sidebar and page headers need on every rerun in one
+    cached call over a single pooled connection: the database version stamp,
+    sidebar counts, and the active rating model.
+    
+    The short TTL lets rapid widget interactions reuse the result instead of
+    querying the database on every rerun.
+    
+    Returns:
+        Dict with 'version', 'player_count', 'tournament_count', 'rating_mode'
+    """
+    snapshot = {'version': "0", 'player_count': 0, 'tournament_count': 0, 'rating_mode': None}
+    try:
+        with get_engine().connect() as conn:
+            row = conn.execute(_SNAPSHOT_STATS_SQL).one()
+            try:
+                snapshot['rating_mode'] = conn.execute(_ACTIVE_RATING_MODE_SQL).scalar()
+            except Exception:
+                pass  # Older databases without rating_mode
+    except Exception:
+        return snapshot
+    
+    last_update = row.last_update
+    if not last_update:
+        version_iso = "0"
+    elif hasattr(last_update, 'isoformat'):
+        version_iso = last_update.isoformat()
+    else:
+        version_iso = str(last_update)  # SQLite returns timestamps as text
+    
+    snapshot.update(
+        version=version_iso,
+        player_count=int(row.player_count),
+        tournament_count=int(row.tournament_count)
+    )
+    return snapshot
+
 def get_cached_system_stats(_cache_key):
-    """Cache sidebar system statistics using direct SQL queries."""
-    player_count = pd.read_sql("SELECT COUNT(*) as count FROM players", db_engine).iloc[0]['count']
-    tournament_count = pd.read_sql("SELECT COUNT(*) as count FROM tournaments", db_engine).iloc[0]['count']
+    """Sidebar system statistics, served from the shared snapshot fetch."""
+    snapshot = _get_db_snapshot()
     
     return {
-        'player_count': int(player_count),
-        'tournament_count': int(tournament_count),
-        'has_data': player_count > 0
+        'player_count': snapshot['player_count'],
+        'tournament_count': snapshot['tournament_count'],
+        'has_data': snapshot['player_count'] > 0
     }
 
-def get_latest_db_update():
-    """Get the latest update timestamp from the players table to use as cache key."""
+def get_db_version():
+    """Get the latest players update timestamp to use as a cache key for DB-backed queries."""
+    return _get_db_snapshot()['version']
+
+def get_tournament_count():
+    """Get the number of tournaments from the shared snapshot instead of loading the tournament list."""
+    return _get_db_snapshot()['tournament_count']
+
+def get_active_rating_mode():
+    """Get the rating model currently active for FSI/points, defaulting to singles only."""
+    return _get_db_snapshot()['rating_mode'] or 'singles_only'
+
+def _get_z_score_baseline():
+    """
+    Read the static Z-Score baseline (mean, std) from the active system parameters
+    as a single row, falling back to (0.0, 1.0). A zero std is replaced by 1.0.
+    """
     try:
-        sql = "SELECT MAX(updated_at) as last_update FROM players"
-        result = pd.read_sql(sql, db_engine)
-        if not result.empty and result.iloc[0]['last_update']:
-            return result.iloc[0]['last_update'].isoformat()
-    except:
-        pass
-    return "0"
+        with get_engine().connect() as conn:
+            row = conn.execute(_Z_SCORE_BASELINE_SQL).first()
+    except Exception:
+        row = None
+    
+    baseline_mean = row.z_score_baseline_mean if row and row.z_score_baseline_mean is not None else 0.0
+    baseline_std = row.z_score_baseline_std if row and row.z_score_baseline_std else 1.0  # Avoid division by zero
+    return baseline_mean, baseline_std
 
-@st.cache_data
+def _column_exists_probe(column):
+    """Raise if the players table has no such column (used to detect older schemas)."""
+    with get_engine().connect() as conn:
+        conn.execute(text(f"SELECT {column} FROM players LIMIT 1")).first()
+
+@st.cache_data(persist="disk")
 def get_cached_rankings(_cache_key, db_version, tournament_group=None, rating_model='singles_only'):
     """
     Cache player rankings using direct SQL query.
     Updated for TTT migration with multi-model support.
+    Persisted to disk, so a restarted server reuses the frame for the same db_version.
     
     Args:
         _cache_key: Manual cache invalidation key
@@ -94,93 +333,303 @@ def get_cached_rankings(_cache_key, db_version, tournament_group=None, rating_mo
     """
     # Determine which columns to use based on rating model
     model_columns = {
-        'singles_only': ('current_rating_mu_singles', 'current_rating_sigma_singles', 'singles_tournaments_played'),
-        'singles_doubles': ('current_rating_mu_combined', 'current_rating_sigma_combined', 'tournaments_played'),
-        'doubles_only': ('current_rating_mu_doubles', 'current_rating_sigma_doubles', 'doubles_tournaments_played'),
+        'singles_only': ('current_rating_mu_singles', 'current_rating_sigma_singles', 'singles_tournaments_played', 'conservative_rating_singles'),
+        'singles_doubles': ('current_rating_mu_combined', 'current_rating_sigma_combined', 'tournaments_played', 'conservative_rating_combined'),
+        'doubles_only': ('current_rating_mu_doubles', 'current_rating_sigma_doubles', 'doubles_tournaments_played', 'conservative_rating_doubles'),
     }
     
-    mu_col, sigma_col, tournaments_col = model_columns.get(rating_model, model_columns['singles_only'])
+    mu_col, sigma_col, tournaments_col, conservative_col = model_columns.get(rating_model, model_columns['singles_only'])
     
-    # Check if the new columns exist, fallback to legacy if not
+    # Prefer the stored (indexed) conservative rating column; older databases only
+    # have the mu/sigma columns, and the oldest only the legacy pair
     try:
-        test_sql = f"SELECT {mu_col} FROM players LIMIT 1"
-        pd.read_sql(test_sql, db_engine)
+        _column_exists_probe(conservative_col)
     except:
-        # Fallback to legacy columns
-        mu_col = 'current_rating_mu'
-        sigma_col = 'current_rating_sigma'
-        tournaments_col = 'tournaments_played'
+        conservative_col = None
+        try:
+            _column_exists_probe(mu_col)
+        except:
+            # Fallback to legacy columns
+            mu_col = 'current_rating_mu'
+            sigma_col = 'current_rating_sigma'
+            tournaments_col = 'tournaments_played'
+    
+    if conservative_col is None:
+        conservative_col = f"(COALESCE({mu_col}, current_rating_mu) - 3 * COALESCE({sigma_col}, current_rating_sigma))"
     
-    # Always get all players first to establish global ranks
+    # Flag group membership in the same pass so global ranks are kept after filtering.
+    # EXISTS stops at the first matching result instead of scanning all of tournament_results.
+    params = {}
+    group_sql = ""
+    if tournament_group:
+        group_sql = """,
+            EXISTS (
+                SELECT 1
+                FROM tournament_results tr
+                JOIN tournaments t ON tr.tournament_id = t.id
+                WHERE tr.player_id = p.id
+                  AND t.tournament_group = :group
+                  AND t.tournament_format = 'singles'
+            ) as in_group"""
+        params['group'] = tournament_group
+    
+    # Always get all players first to establish global ranks (rank and rounding done in SQL)
     sql_all = f"""
         SELECT 
-            name as player,
-            COALESCE({mu_col}, current_rating_mu) as rating,
-            COALESCE({sigma_col}, current_rating_sigma) as uncertainty,
-            (COALESCE({mu_col}, current_rating_mu) - 3 * COALESCE({sigma_col}, current_rating_sigma)) as conservative_rating,
-            COALESCE({tournaments_col}, tournaments_played) as tournaments_played
-        FROM players
-        ORDER BY conservative_rating DESC
+            ROW_NUMBER() OVER (ORDER BY {conservative_col} DESC, p.id) as rank,
+            p.name as player,
+            ROUND(COALESCE({mu_col}, current_rating_mu), 2) as rating,
+            ROUND(COALESCE({sigma_col}, current_rating_sigma), 2) as uncertainty,
+            ROUND({conservative_col}, 2) as conservative_rating,
+            COALESCE({tournaments_col}, tournaments_played) as tournaments_played{group_sql}
+        FROM players p
+        ORDER BY rank
     """
-    all_rankings_df = pd.read_sql(sql_all, db_engine)
+    all_rankings_df = _read_sql_raw(sql_all, params)
     
     if len(all_rankings_df) == 0:
-        return pd.DataFrame()
-    
-    # Round numerical columns
-    all_rankings_df['rating'] = all_rankings_df['rating'].round(2)
-    all_rankings_df['uncertainty'] = all_rankings_df['uncertainty'].round(2)
-    all_rankings_df['conservative_rating'] = all_rankings_df['conservative_rating'].round(2)
+        return all_rankings_df
     
     # Calculate Z-Score based on static baseline
-    sql_params = "SELECT z_score_baseline_mean, z_score_baseline_std FROM system_parameters WHERE is_active = 1 LIMIT 1"
-    try:
-        params_df = pd.read_sql(sql_params, db_engine)
-        if not params_df.empty:
-            baseline_mean = params_df.iloc[0]['z_score_baseline_mean']
-            baseline_std = params_df.iloc[0]['z_score_baseline_std']
-        else:
-            baseline_mean = 0.0
-            baseline_std = 1.0
-    except:
-        baseline_mean = 0.0
-        baseline_std = 1.0
-        
-    # Avoid division by zero
-    if baseline_std == 0:
-        baseline_std = 1.0
-        
+    baseline_mean, baseline_std = _get_z_score_baseline()
+    
     all_rankings_df['z_score'] = (all_rankings_df['conservative_rating'] - baseline_mean) / baseline_std
     
     # Calculate Pseudo-ELO from Z-Score
-    import numpy as np
     elo_values = 1900 + 220 * all_rankings_df['z_score']
     elo_values = np.maximum(elo_values, 1500)  # Apply 1500 floor
     all_rankings_df['pseudo_elo'] = np.rint(elo_values).astype(int)  # Round to integer
     
-    # Add global rank column (before filtering)
-    all_rankings_df.insert(0, 'rank', range(1, len(all_rankings_df) + 1))
-    
     # If tournament group filter is specified, filter the results but keep global ranks
     if tournament_group:
-        # Get list of players who participated in this group's singles tournaments
-        sql_filter = """
-            SELECT DISTINCT p.name
-            FROM players p
-            JOIN tournament_results tr ON p.id = tr.player_id
-            JOIN tournaments t ON tr.tournament_id = t.id
-            WHERE t.tournament_group = :group
-              AND t.tournament_format = 'singles'
-        """
-        filtered_players = pd.read_sql(sql_filter, db_engine, params={'group': tournament_group})
-        
-        # Filter all_rankings_df to only include these players (preserving global ranks)
-        rankings_df = all_rankings_df[all_rankings_df['player'].isin(filtered_players['name'])]
+        in_group = all_rankings_df.pop('in_group').astype(bool)
+        rankings_df = all_rankings_df[in_group]
     else:
         rankings_df = all_rankings_df
     
     return rankings_df
 
+@st.cache_data
+def get_cached_player_search_index(_cache_key, db_version, tournament_group=None, rating_model='singles_only'):
+    """
+    Cache lowercased player names aligned row-for-row with get_cached_rankings,
+    so the search box can do a vectorized substring match without re-lowering
+    every name on each keystroke.
+    """
+    rankings_df = get_cached_rankings(_cache_key, db_version, tournament_group=tournament_group, rating_model=rating_model)
+    if len(rankings_df) == 0:
+        return np.array([], dtype=str)
+    return rankings_df['player'].str.lower().to_numpy(dtype=str)
+
+@st.cache_resource(max_entries=8)
+def get_cached_player_choices(_cache_key, db_version, tournament_group=None, rating_model='singles_only'):
+    """
+    Cache the player selectbox options (rank order) as a tuple. cache_resource
+    hands back the same object on every rerun instead of rebuilding a list.
+    Bounded like get_cached_rankings_table, as resource caches outlive data versions.
+    """
+    rankings_df = get_cached_rankings(_cache_key, db_version, tournament_group=tournament_group, rating_model=rating_model)
+    return tuple(rankings_df['player'])
+
+@st.cache_resource(max_entries=8)
+def get_cached_rankings_table(_cache_key, db_version, tournament_group=None, rating_model='singles_only'):
+    """
+    Cache the ratings grid as an Arrow table, so st.dataframe skips its own
+    pandas-to-Arrow conversion on each rerun. Falls back to the DataFrame when
+    pyarrow is unavailable. Bounded, since st.cache_data.clear() does not evict
+    resource caches and each data version adds a table per filter combination.
+    """
+    rankings_df = get_cached_rankings(_cache_key, db_version, tournament_group=tournament_group, rating_model=rating_model)
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return rankings_df
+    return pa.Table.from_pandas(rankings_df, preserve_index=False)
+
+@st.cache_data
+def get_cached_rankings_csv(_cache_key, db_version, tournament_group=None, rating_model='singles_only'):
+    """Cache the ratings CSV export (as bytes) so it is not re-serialized on every rerun."""
+    rankings_df = get_cached_rankings(_cache_key, db_version, tournament_group=tournament_group, rating_model=rating_model)
+    return _to_csv_bytes(rankings_df)
+
+@st.cache_data(show_spinner=False)
+def get_cached_player_history(_cache_key, db_version, _engine, player_name, rating_model='singles_only'):
+    """Cache a player's rating history so reruns from unrelated widgets skip the engine lookup."""
+    return _engine.get_player_history(player_name, rating_model=rating_model)
+
+def _hover_text(values):
+    """Format values to 2 decimals for hover text, with a dash for missing ones."""
+    values = pd.Series(values, dtype=float)
+    return values.map('{:.2f}'.format).where(values.notna(), '—').to_numpy()
+
+def _build_player_history_figure(history_df):
+    """Build the rating history chart (Revised, BEFORE, μ and AFTER lines) for one player."""
+    # Create tournament labels (tournament name + season on one line)
+    tournament_labels = (history_df['tournament'].astype(str) + ' S'
+                         + history_df['season'].astype(str)).tolist()
+    # Plot against a numeric position (labels go on the ticks) so hover
+    # picking stays cheap; long histories render through WebGL.
+    x_positions = np.arange(len(history_df))
+    scatter_trace = go.Scattergl if len(history_df) >= 200 else go.Scatter
+    
+    # BEFORE series: forward conservative rating entering each tournament
+    # (no future info), falling back to backward-smoothed if not available
+    if ('before_mu_forward' in history_df.columns and 'before_sigma_forward' in history_df.columns
+        and history_df['before_mu_forward'].notna().any() and history_df['before_sigma_forward'].notna().any()):
+        # Calculate conservative rating from forward values: mu - 3*sigma
+        before_values = history_df['before_mu_forward'] - 3 * history_df['before_sigma_forward']
+        # Filter out extreme negative values (first tournament effect)
+        before_values = before_values.where(before_values > -3.0)
+        before_name = 'BEFORE Tournament (Forward)'
+        before_is_forward = True
+    else:
+        before_values = history_df['conservative_rating_before']
+        before_name = 'BEFORE Tournament (Smoothed)'
+        before_is_forward = False
+    
+    # AFTER series: forward-only conservative rating (if available)
+    # Skip extreme first-tournament values (typically very negative due to high initial uncertainty)
+    if 'conservative_rating_forward' in history_df.columns and history_df['conservative_rating_forward'].notna().any():
+        # Set values below -3 (3 sigma below 0 mean) to NaN
+        forward_values = history_df['conservative_rating_forward'].where(
+            history_df['conservative_rating_forward'] > -3.0)
+    else:
+        forward_values = None
+    
+    # Only the Revised trace is hoverable; it carries every series in
+    # customdata so a single pick reports all of them. The other lines
+    # are drawn as overlays with hover disabled. Values are pre-formatted
+    # so missing ones show a dash instead of "NaN".
+    hover_data = pd.DataFrame({
+        'label': tournament_labels,
+        'before': _hover_text(before_values.to_numpy()),
+        'mu': _hover_text(history_df['after_mu'].to_numpy()),
+        'after': _hover_text(forward_values.to_numpy()) if forward_values is not None else '—',
+    }).to_numpy(dtype=object)
+    hover_lines = ['%{customdata[0]}',
+                   '<b>Revised Cons.: %{y:.2f}</b> <i>(full history)</i>',
+                   '<b>Before: %{customdata[1]}</b> <i>(entering)</i>',
+                   '<b>Mean Rating μ: %{customdata[2]}</b>']
+    if forward_values is not None:
+        hover_lines.append('<b>After: %{customdata[3]}</b> <i>(no future info)</i>')
+    
+    fig = go.Figure()
+    
+    # Trace 1: Revised Conservative Rating (Smoothed)
+    fig.add_trace(scatter_trace(
+        x=x_positions,
+        y=history_df['conservative_rating'],
+        mode='lines+markers',
+        name='Revised Conservative (Smoothed)',
+        line=dict(color='#1f77b4', width=3),
+        customdata=hover_data,
+        hovertemplate='<br>'.join(hover_lines) + '<extra></extra>'
+    ))
+    
+    # Trace 2: Conservative Rating BEFORE tournament
+    fig.add_trace(scatter_trace(
+        x=x_positions,
+        y=before_values,
+        mode='lines+markers',
+        name=before_name,
+        line=dict(color='#d62728', width=2, dash='dash'),
+        connectgaps=True,
+        hoverinfo='skip'
+    ))
+    
+    # Trace 3: Mu (Mean Rating)
+    fig.add_trace(scatter_trace(
+        x=x_positions,
+        y=history_df['after_mu'],
+        mode='lines+markers',
+        name='Mean Rating (μ)',
+        line=dict(color='#ff7f0e', width=2, dash='dot'),
+        hoverinfo='skip'
+    ))
+    
+    # Trace 4: Forward-Only Conservative Rating - AFTER tournament
+    if forward_values is not None:
+        fig.add_trace(scatter_trace(
+            x=x_positions,
+            y=forward_values,
+            mode='lines+markers',
+            name='AFTER Tournament (Forward)',
+            line=dict(color='#2ca02c', width=2, dash='dashdot'),
+            connectgaps=True,
+            hoverinfo='skip'
+        ))
+    
+    # Calculate Y-axis range to prevent micro-movements from looking huge
+    # Exclude extreme forward values from range calculation (already NaN
+    # in the plotted forward series); the smoothed BEFORE fallback is not used
+    y_columns = [history_df['conservative_rating'], history_df['after_mu']]
+    if forward_values is not None:
+        y_columns.append(forward_values)
+    if before_is_forward:
+        y_columns.append(before_values)
+    all_y_values = np.column_stack([col.to_numpy(dtype=float) for col in y_columns])
+    y_min = np.nanmin(all_y_values)
+    y_max = np.nanmax(all_y_values)
+    y_range = y_max - y_min
+    
+    # Enforce a minimum range of 0.5
+    min_range = 0.5
+    if y_range < min_range:
+        midpoint = (y_max + y_min) / 2
+        y_axis_range = [midpoint - (min_range / 2), midpoint + (min_range / 2)]
+    else:
+        # Add a little padding (5%) so points aren't on the edge
+        padding = y_range * 0.05
+        y_axis_range = [y_min - padding, y_max + padding]
+
+    fig.update_layout(
+        title=dict(
+            text="<b>Live vs. Revised Conservative Rating</b>",
+            x=0.05,
+            xanchor='left'
+        ),
+        xaxis_title="Tournament",
+        yaxis_title="Conservative Rating (μ - 3σ)",
+        hovermode='x',
+        height=500,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        xaxis=dict(
+            tickmode='array',
+            tickvals=x_positions,
+            ticktext=tournament_labels,
+            tickfont=dict(size=9),
+            tickangle=90,
+            showgrid=True,
+            gridcolor='lightgray',
+            gridwidth=1
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridcolor='lightgray',
+            range=y_axis_range
+        ),
+        margin=dict(t=80)  # Add margin for title/legend
+    )
+    
+    return fig
+
+@st.cache_resource(max_entries=32)
+def get_cached_player_history_figure(_cache_key, db_version, _engine, player_name, rating_model='singles_only'):
+    """
+    Cache the assembled rating history figure per player and rating model, so
+    reruns from unrelated widgets reuse the same Figure instead of rebuilding it.
+    Bounded, since resource caches are not emptied by st.cache_data.clear() and
+    every viewed player (per data version) would otherwise keep a Figure alive.
+    """
+    player_history = get_cached_player_history(_cache_key, db_version, _engine, player_name, rating_model=rating_model)
+    return _build_player_history_figure(pd.DataFrame(player_history))
+
 @st.cache_data
 def get_cached_tournaments(_cache_key):
     """Cache tournament list using direct SQL query."""
@@ -197,57 +646,52 @@ def get_cached_tournaments(_cache_key):
             created_at ASC,
             id ASC
     """
-    tournaments_df = pd.read_sql(sql, db_engine)
+    tournaments_df = _read_sql_raw(sql)
     
     return tournaments_df
 
-@st.cache_data
-def get_cached_season_standings(_cache_key, season=None, tournament_group=None):
+@st.cache_data(persist="disk")
+def get_cached_season_standings(_cache_key, db_version="0", season=None, tournament_group=None):
     """Cache season standings with optional filters using parameterized queries."""
-    params = {}
-    where_clauses = []
-    
-    if season:
-        where_clauses.append("t.season = :season")
-        params['season'] = season
-    
-    if tournament_group:
-        where_clauses.append("t.tournament_group = :tournament_group")
-        params['tournament_group'] = tournament_group
-    
-    where_sql = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+    where_sql, params = _build_where([
+        ('t.season', season),
+        ('t.tournament_group', tournament_group),
+    ])
     
     sql = f"""
         WITH ranked_events AS (
             SELECT 
-                p.id as player_id,
-                p.name as player,
+                sep.player_id,
                 sep.season,
                 sep.total_points,
                 t.tournament_format,
-                p.current_rating_mu,
-                p.current_rating_sigma,
-                ROW_NUMBER() OVER (PARTITION BY p.id, sep.season ORDER BY sep.total_points DESC) as event_rank
+                ROW_NUMBER() OVER (PARTITION BY sep.player_id, sep.season ORDER BY sep.total_points DESC) as event_rank
             FROM season_event_points sep
             JOIN tournaments t ON sep.tournament_id = t.id
-            JOIN players p ON sep.player_id = p.id
             {where_sql}
         ),
-        player_totals AS (
+        top_events AS (
             SELECT 
                 player_id,
-                player,
                 season,
                 SUM(total_points) as total_points,
                 SUM(CASE WHEN tournament_format = 'doubles' THEN total_points ELSE 0 END) as doubles_points,
                 SUM(CASE WHEN tournament_format != 'doubles' OR tournament_format IS NULL THEN total_points ELSE 0 END) as singles_points,
-                COUNT(*) as events_counted,
-                MAX(current_rating_mu) as current_rating_mu,
-                MAX(current_rating_sigma) as current_rating_sigma,
-                MAX(current_rating_mu - 3 * current_rating_sigma) as final_display_rating
+                COUNT(*) as events_counted
             FROM ranked_events
             WHERE event_rank <= 5
-            GROUP BY player_id, player, season
+            GROUP BY player_id, season
+        ),
+        player_totals AS (
+            -- Player details are joined once per aggregated row, not once per event
+            SELECT 
+                te.*,
+                p.name as player,
+                p.current_rating_mu,
+                p.current_rating_sigma,
+                p.current_rating_mu - 3 * p.current_rating_sigma as final_display_rating
+            FROM top_events te
+            JOIN players p ON te.player_id = p.id
         )
         SELECT 
             ROW_NUMBER() OVER (PARTITION BY season ORDER BY total_points DESC) as rank,
@@ -264,29 +708,13 @@ def get_cached_season_standings(_cache_key, season=None, tournament_group=None):
         ORDER BY season DESC, rank ASC
     """
     
-    df = pd.read_sql(sql, db_engine, params=params)
+    df = _read_sql_raw(sql, params)
     
     if len(df) > 0:
         # Calculate Z-Score and Pseudo-ELO
-        import numpy as np
         
         # Get Z-Score baseline parameters
-        sql_params = "SELECT z_score_baseline_mean, z_score_baseline_std FROM system_parameters WHERE is_active = 1 LIMIT 1"
-        try:
-            params_df = pd.read_sql(sql_params, db_engine)
-            if not params_df.empty:
-                baseline_mean = params_df.iloc[0]['z_score_baseline_mean']
-                baseline_std = params_df.iloc[0]['z_score_baseline_std']
-            else:
-                baseline_mean = 0.0
-                baseline_std = 1.0
-        except:
-            baseline_mean = 0.0
-            baseline_std = 1.0
-        
-        # Avoid division by zero
-        if baseline_std == 0:
-            baseline_std = 1.0
+        baseline_mean, baseline_std = _get_z_score_baseline()
         
         # Calculate conservative rating, Z-Score, and Pseudo-ELO
         df['conservative_rating'] = df['current_rating_mu'] - 3 * df['current_rating_sigma']
@@ -298,102 +726,106 @@ def get_cached_season_standings(_cache_key, season=None, tournament_group=None):
         # Drop intermediate columns
         df = df.drop(columns=['current_rating_mu', 'current_rating_sigma', 'conservative_rating', 'z_score'])
     
-    return df if len(df) > 0 else pd.DataFrame()
+    return df
 
-@st.cache_data
-def get_cached_event_points(_cache_key, tournament_id=None, season=None):
+@st.cache_data(persist="disk")
+def get_cached_standings_seasons(_cache_key, db_version="0"):
+    """
+    Cache the normalized seasons that have standings, newest first (numeric order,
+    so Season 16 comes before Season 9). Reruns then read this small tuple instead
+    of the full standings frame.
+    """
+    standings_df = get_cached_season_standings(_cache_key, db_version)
+    seasons = {normalize_season(s) for s in standings_df['season'].unique().tolist()}
+    return tuple(sorted(seasons, key=int, reverse=True))
+
+@st.cache_data(persist="disk")
+def get_cached_event_points(_cache_key, db_version="0", tournament_id=None, season=None):
     """Cache event points using parameterized SQL queries."""
-    if tournament_id:
-        sql = """
-            SELECT t.event_name, t.season, p.id as player_id, p.name as player, 
-                   sep.place, sep.field_size,
-                   sep.fsi, sep.raw_points, sep.base_points, sep.expected_rank,
-                   sep.overperformance, sep.bonus_points, sep.total_points
-            FROM season_event_points sep
-            JOIN tournaments t ON sep.tournament_id = t.id
-            JOIN players p ON sep.player_id = p.id
-            WHERE sep.tournament_id = :tournament_id
-            ORDER BY sep.total_points DESC
-        """
-        df = pd.read_sql(sql, db_engine, params={'tournament_id': tournament_id})
-    elif season:
-        sql = """
-            SELECT t.event_name, t.season, p.id as player_id, p.name as player, 
-                   sep.place, sep.field_size,
-                   sep.fsi, sep.raw_points, sep.base_points, sep.expected_rank,
-                   sep.overperformance, sep.bonus_points, sep.total_points
-            FROM season_event_points sep
-            JOIN tournaments t ON sep.tournament_id = t.id
-            JOIN players p ON sep.player_id = p.id
-            WHERE sep.season = :season
-            ORDER BY sep.total_points DESC
-        """
-        df = pd.read_sql(sql, db_engine, params={'season': season})
-    else:
-        sql = """
-            SELECT t.event_name, t.season, p.id as player_id, p.name as player, 
-                   sep.place, sep.field_size,
-                   sep.fsi, sep.raw_points, sep.base_points, sep.expected_rank,
-                   sep.overperformance, sep.bonus_points, sep.total_points
-            FROM season_event_points sep
-            JOIN tournaments t ON sep.tournament_id = t.id
-            JOIN players p ON sep.player_id = p.id
-            ORDER BY sep.total_points DESC
-        """
-        df = pd.read_sql(sql, db_engine)
-    return df if len(df) > 0 else pd.DataFrame()
+    where_sql, params = _build_where([
+        ('sep.tournament_id', tournament_id),
+        ('sep.season', season),
+    ])
+    sql = f"""
+        SELECT t.event_name, t.season, p.id as player_id, p.name as player, 
+               sep.place, sep.field_size,
+               sep.fsi, sep.raw_points, sep.base_points, sep.expected_rank,
+               sep.overperformance, sep.bonus_points, sep.total_points
+        FROM season_event_points sep
+        JOIN tournaments t ON sep.tournament_id = t.id
+        JOIN players p ON sep.player_id = p.id
+        {where_sql}
+        ORDER BY sep.total_points DESC
+    """
+    df = _read_sql_raw(sql, params)
+    return df
 
-@st.cache_data
-def get_cached_tournament_fsi(_cache_key, season=None):
+@st.cache_data(persist="disk")
+def get_cached_tournament_fsi(_cache_key, db_version="0", season=None):
     """Cache tournament FSI data using parameterized SQL queries."""
-    if season:
-        sql = """
-            SELECT t.id, t.event_name, t.season, t.tournament_date,
-                   tf.fsi, tf.avg_top_mu
-            FROM tournament_fsi tf
-            JOIN tournaments t ON tf.tournament_id = t.id
-            WHERE t.season = :season
-            ORDER BY t.sequence_order ASC NULLS LAST,
-                     t.tournament_date ASC NULLS LAST,
-                     t.id ASC
-        """
-        df = pd.read_sql(sql, db_engine, params={'season': season})
+    where_sql, params = _build_where([('t.season', season)])
+    sql = f"""
+        SELECT t.id, t.event_name, t.season, t.tournament_date,
+               tf.fsi, tf.avg_top_mu
+        FROM tournament_fsi tf
+        JOIN tournaments t ON tf.tournament_id = t.id
+        {where_sql}
+        ORDER BY t.sequence_order ASC NULLS LAST,
+                 t.tournament_date ASC NULLS LAST,
+                 t.id ASC
+    """
+    df = _read_sql_raw(sql, params)
+    return df
+
+@st.cache_data
+def get_cached_tournament_strength(_cache_key, db_version, _engine, scaling_factor):
+    """
+    Cache tournament strength data merged with FSI, plus the fsi_raw/fsi_all
+    metrics for the given scaling factor. Group/type filters are applied by the
+    caller on the cached frame.
+    """
+    # Get tournament strength data (now includes id, date, group, avg_rating_before, tournament_format)
+    tournament_df = _engine.get_tournament_strength()
+    
+    # Get FSI data
+    fsi_df = get_cached_tournament_fsi(_cache_key, db_version)
+    
+    # Merge FSI data if available
+    if not fsi_df.empty:
+        # Merge on id
+        tournament_df = pd.merge(tournament_df, fsi_df[['id', 'fsi', 'avg_top_mu']], on='id', how='left')
     else:
-        sql = """
-            SELECT t.id, t.event_name, t.season, t.tournament_date,
-                   tf.fsi, tf.avg_top_mu
-            FROM tournament_fsi tf
-            JOIN tournaments t ON tf.tournament_id = t.id
-            ORDER BY t.sequence_order ASC NULLS LAST,
-                     t.tournament_date ASC NULLS LAST,
-                     t.id ASC
-        """
-        df = pd.read_sql(sql, db_engine)
-    return df if len(df) > 0 else pd.DataFrame()
+        tournament_df['fsi'] = 0.0
+        tournament_df['avg_top_mu'] = 0.0
+    
+    # Calculate new metrics
+    # Handle NaN values for tournaments without FSI data
+    tournament_df = tournament_df.fillna({'avg_top_mu': 0.0, 'fsi': 0.0}).assign(
+        fsi_raw=lambda d: d['avg_top_mu'] / scaling_factor,
+        fsi_all=lambda d: d['avg_rating_before'] / scaling_factor
+    )
+    
+    # Display-ready date and rating columns, newest first, so reruns only filter and select
+    tournament_df['date_display'] = pd.to_datetime(tournament_df['tournament_date']).dt.strftime('%Y-%m-%d')
+    tournament_df['avg_rating_display'] = pd.to_numeric(tournament_df['avg_rating_before'], errors='coerce').round(2)
+    return tournament_df.sort_values('date_display', ascending=False, kind='stable')
 
 @st.cache_data
 def get_cached_players_with_points(_cache_key):
     """Cache list of players who have season points."""
-    sql = """
-        SELECT DISTINCT p.id, p.name
-        FROM players p
-        JOIN season_event_points sep ON p.id = sep.player_id
-        ORDER BY p.name
-    """
-    return pd.read_sql(sql, db_engine)
+    return _read_sql_raw(_PLAYERS_WITH_POINTS_SQL)
 
-@st.cache_data
-def get_cached_all_seasons(_cache_key):
-    """Cache list of all distinct seasons."""
-    # Cast to integer for proper numeric sorting (16 before 9)
-    sql = "SELECT DISTINCT season FROM tournaments ORDER BY CAST(season AS INTEGER) DESC"
-    return pd.read_sql(sql, db_engine)
+@st.cache_resource(ttl=60)
+def get_cached_all_seasons(_cache_key, db_version="0"):
+    """Cache tuple of all distinct seasons, keyed by database version."""
+    with get_engine().connect() as conn:
+        return tuple(row[0] for row in conn.execute(_ALL_SEASONS_SQL))
 
-@st.cache_data
-def get_cached_tournament_groups(_cache_key):
-    """Cache list of all distinct tournament groups."""
-    sql = "SELECT DISTINCT tournament_group FROM tournaments WHERE tournament_group IS NOT NULL ORDER BY tournament_group"
-    return pd.read_sql(sql, db_engine)
+@st.cache_resource(ttl=60)
+def get_cached_tournament_groups(_cache_key, db_version="0"):
+    """Cache tuple of all distinct tournament groups, keyed by database version."""
+    with get_engine().connect() as conn:
+        return tuple(row[0] for row in conn.execute(_TOURNAMENT_GROUPS_SQL))
 
 @st.cache_data
 def get_cached_player_tournament_events(_cache_key, player_name, season=None):
@@ -410,7 +842,7 @@ def get_cached_player_tournament_events(_cache_key, player_name, season=None):
             WHERE p.name = :player_name AND t.season = :season
             ORDER BY sep.total_points DESC
         """
-        df = pd.read_sql(sql, db_engine, params={'player_name': player_name, 'season': season})
+        df = _read_sql_raw(sql, {'player_name': player_name, 'season': season})
     else:
         sql = """
             SELECT t.event_name, t.season, t.tournament_date, t.tournament_format,
@@ -423,28 +855,36 @@ def get_cached_player_tournament_events(_cache_key, player_name, season=None):
             WHERE p.name = :player_name
             ORDER BY sep.total_points DESC
         """
-        df = pd.read_sql(sql, db_engine, params={'player_name': player_name})
-    return df if len(df) > 0 else pd.DataFrame()
+        df = _read_sql_raw(sql, {'player_name': player_name})
+    return df
 
 @st.cache_data
 def get_cached_tournaments_list(_cache_key, season=None):
     """Cache tournaments list for dropdown selections."""
-    if season:
-        sql = """
-            SELECT id, event_name, season, tournament_date, num_players, tournament_format
-            FROM tournaments
-            WHERE season = :season
-            ORDER BY tournament_date DESC NULLS LAST, sequence_order ASC NULLS LAST
-        """
-        df = pd.read_sql(sql, db_engine, params={'season': season})
-    else:
-        sql = """
-            SELECT id, event_name, season, tournament_date, num_players, tournament_format
-            FROM tournaments
-            ORDER BY tournament_date DESC NULLS LAST, sequence_order ASC NULLS LAST
-        """
-        df = pd.read_sql(sql, db_engine)
-    return df if len(df) > 0 else pd.DataFrame()
+    where_sql, params = _build_where([('season', season)])
+    sql = f"""
+        SELECT id, event_name, season, tournament_date, num_players, tournament_format
+        FROM tournaments
+        {where_sql}
+        ORDER BY tournament_date DESC NULLS LAST, sequence_order ASC NULLS LAST
+    """
+    df = _read_sql_raw(sql, params)
+    return df
+
+@st.cache_data(ttl=600, show_spinner=False)
+def get_cached_tournaments_chronological(_cache_key, db_version):
+    """Cache the tournament table in processing order (same order as get_tournaments_chronological)."""
+    sql = """
+        SELECT id, event_name, season, tier, num_players, avg_rating_before,
+               sequence_order, tournament_date, created_at
+        FROM tournaments
+        ORDER BY sequence_order ASC NULLS LAST, tournament_date ASC NULLS LAST, id ASC
+    """
+    df = _read_sql_raw(sql)
+    # SQLite hands timestamps back as text
+    df['tournament_date'] = pd.to_datetime(df['tournament_date'], errors='coerce')
+    df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce')
+    return df
 
 @st.cache_data
 def get_cached_tournaments_with_fsi(_cache_key, tournament_group=None):
@@ -457,7 +897,7 @@ def get_cached_tournaments_with_fsi(_cache_key, tournament_group=None):
             WHERE t.tournament_group = :tournament_group
             ORDER BY t.tournament_date DESC NULLS LAST, t.created_at DESC
         """
-        return pd.read_sql(sql, db_engine, params={'tournament_group': tournament_group})
+        return _read_sql_raw(sql, {'tournament_group': tournament_group})
     else:
         sql = """
             SELECT t.id, t.season, t.event_name, t.tournament_date, t.tournament_format, t.tournament_group, tf.fsi
@@ -465,73 +905,119 @@ def get_cached_tournaments_with_fsi(_cache_key, tournament_group=None):
             JOIN tournament_fsi tf ON t.id = tf.tournament_id
             ORDER BY t.tournament_date DESC NULLS LAST, t.created_at DESC
         """
-        return pd.read_sql(sql, db_engine)
+        return _read_sql_raw(sql)
 
 @st.cache_data
 def get_cached_team_info(_cache_key, tournament_id):
     """Cache team information for doubles tournaments."""
-    sql = """
-        SELECT tr.player_id, tr.team_key, p.name as player_name
-        FROM tournament_results tr
-        JOIN players p ON tr.player_id = p.id
-        WHERE tr.tournament_id = :tournament_id
-        ORDER BY tr.place, p.name
+    return _read_sql_raw(_TEAM_INFO_SQL, {'tournament_id': int(tournament_id)})
+
+@st.cache_data(persist="disk")
+def get_cached_points_by_place(_cache_key, db_version, tournament_group):
+    """
+    Cache points distribution data for one tournament group (None = ungrouped
+    tournaments). Each group is its own cache entry; use get_points_by_place
+    to combine them for the "All" view.
     """
-    return pd.read_sql(sql, db_engine, params={'tournament_id': int(tournament_id)})
+    return _read_sql_raw(_POINTS_BY_PLACE_SQL, {'tournament_group': tournament_group})
 
-@st.cache_data
-def get_cached_points_by_place(_cache_key, tournament_group=None):
-    """Cache points distribution data for FSI trends visualization."""
+def get_points_by_place(_cache_key, db_version="0", tournament_group=None):
+    """
+    Points distribution data for FSI trends visualization.
+    
+    A specific group is served straight from its cache entry; with no group the
+    per-group entries are concatenated, so the full history is never cached a
+    second time as its own entry.
+    """
     if tournament_group:
-        sql = """
-            SELECT 
-                t.id as tournament_id,
-                t.event_name,
-                t.season,
-                t.tournament_format,
-                t.tournament_group,
-                t.tournament_date,
-                sep.place,
-                sep.total_points,
-                sep.field_size,
-                tf.fsi
-            FROM season_event_points sep
-            JOIN tournaments t ON sep.tournament_id = t.id
-            JOIN tournament_fsi tf ON sep.tournament_id = tf.tournament_id
-            WHERE t.tournament_group = :tournament_group
-            ORDER BY t.tournament_date DESC, t.id, sep.place
-        """
-        return pd.read_sql(sql, db_engine, params={'tournament_group': tournament_group})
-    else:
-        sql = """
-            SELECT 
-                t.id as tournament_id,
-                t.event_name,
-                t.season,
-                t.tournament_format,
-                t.tournament_group,
-                t.tournament_date,
-                sep.place,
-                sep.total_points,
-                sep.field_size,
-                tf.fsi
-            FROM season_event_points sep
-            JOIN tournaments t ON sep.tournament_id = t.id
-            JOIN tournament_fsi tf ON sep.tournament_id = tf.tournament_id
-            ORDER BY t.tournament_date DESC, t.id, sep.place
-        """
-        return pd.read_sql(sql, db_engine)
+        return get_cached_points_by_place(_cache_key, db_version, tournament_group)
+    
+    groups = [*get_cached_tournament_groups(_cache_key, db_version), None]
+    parts = [get_cached_points_by_place(_cache_key, db_version, group) for group in groups]
+    parts = [part for part in parts if len(part) > 0]
+    if not parts:
+        return get_cached_points_by_place(_cache_key, db_version, None)
+    
+    points_df = pd.concat(parts, ignore_index=True)
+    points_df = points_df.sort_values(['tournament_date', 'tournament_id', 'place'],
+                                      ascending=[False, True, True], kind='stable', ignore_index=True)
+    return points_df
+
+@st.cache_data
+def get_cached_points_parameters(_cache_key):
+    """
+    Cache the active season points parameters as a plain attribute namespace, so
+    the Parameter Tuning page doesn't open a session on every rerun. Saving new
+    parameters clears st.cache_data.
+    """
+    from database import get_db_session, PointsParameters
+    with get_db_session() as session:
+        points_params = session.query(PointsParameters).filter_by(is_active=1).first()
+        if not points_params:
+            return None
+        return types.SimpleNamespace(**{column.name: getattr(points_params, column.name)
+                                        for column in PointsParameters.__table__.columns})
+
+def get_data_fingerprint():
+    """
+    Cheap fingerprint of the tournament and rating data (tournament count plus the
+    players version stamp), from the shared snapshot. Used to key the exports.
+    """
+    snapshot = _get_db_snapshot()
+    return f"{snapshot['tournament_count']}:{snapshot['version']}"
+
+@st.cache_data(show_spinner=False)
+def get_cached_tournament_export_csv(_cache_key, data_fingerprint, _db):
+    """
+    Cache the import-ready tournament export.
+    
+    Returns:
+        Tuple of (gzipped csv_bytes, tournament_count, result_count)
+    """
+    # One joined query for all results instead of one query per tournament,
+    # collected column-wise so the DataFrame wraps the lists directly
+    export_data = {'season': [], 'event': [], 'tier': [], 'place': [], 'player': [],
+                   'tournament_date': [], 'sequence_order': []}
+    for tournament, place, player_name in _db.get_tournament_export_rows():
+        export_data['season'].append(tournament.season)
+        export_data['event'].append(tournament.event_name)
+        export_data['tier'].append(tournament.tier)
+        export_data['place'].append(place)
+        export_data['player'].append(player_name)
+        export_data['tournament_date'].append(tournament.tournament_date)
+        export_data['sequence_order'].append(tournament.sequence_order if tournament.sequence_order else '')
+    
+    # Format dates in one vectorized pass (missing dates export as '')
+    export_data['tournament_date'] = pd.to_datetime(pd.Series(export_data['tournament_date'], dtype=object),
+                                                    errors='coerce').dt.strftime('%Y-%m-%d').fillna('')
+    export_df = pd.DataFrame(export_data, copy=False)
+    return _gzip_bytes(_to_csv_bytes(export_df)), get_tournament_count(), len(export_df)
+
+@st.cache_data(show_spinner=False)
+def get_cached_flat_logs(_cache_key, data_fingerprint, engine_version, _engine):
+    """Cache the flat calculation logs (one row per tournament and player) for exports."""
+    return _engine.get_flat_logs_df()
+
+@st.cache_data(show_spinner=False)
+def get_cached_calculation_logs_csv(_cache_key, data_fingerprint, engine_version, _engine):
+    """Cache the complete calculation logs export (one row per rating change) as gzipped CSV bytes."""
+    logs_df = get_cached_flat_logs(_cache_key, data_fingerprint, engine_version, _engine)
+    return _gzip_bytes(_to_csv_bytes(logs_df[['tournament', 'season', 'tier', 'player', 'place', 'before_mu', 'after_mu',
+                                              'mu_change', 'before_sigma', 'after_sigma', 'sigma_change']]))
+
+@st.cache_data(show_spinner=False)
+def get_cached_tournament_strength_csv(_cache_key, data_fingerprint, engine_version, _engine):
+    """Cache the tournament strength export as gzipped CSV bytes."""
+    return _gzip_bytes(_to_csv_bytes(_engine.get_tournament_strength()))
 
 def get_cache_timestamp():
     """Get a human-readable timestamp for when data was last updated."""
-    import datetime
     if 'last_cache_update' not in st.session_state:
         st.session_state.last_cache_update = datetime.datetime.now()
     return st.session_state.last_cache_update
 
 def show_cache_freshness():
     """Display cache freshness indicator."""
-    import datetime
     last_update = get_cache_timestamp()
     time_diff = datetime.datetime.now() - last_update
     
@@ -551,9 +1037,51 @@ def show_cache_freshness():
 
 def invalidate_data_cache():
     """Increment cache key to invalidate all cached data after mutations."""
-    import datetime
     st.session_state.data_cache_key += 1
     st.session_state.last_cache_update = datetime.datetime.now()
+    _get_db_snapshot.clear()
+    # Tournament dates and sequence edits don't move the DB version, so these are
+    # cleared explicitly (_cache_key itself is not part of the cache hash)
+    get_cached_tournaments_chronological.clear()
+    get_cached_tier_comparison.clear()
+    get_cached_sequence_table.clear()
+    get_cached_tournament_options.clear()
+
+def make_progress_callback(progress_bar, progress_text, label, text_updates=50,
+                           status_format="{label}: {current}/{total} - {name}", empty_message=None):
+    """
+    Build a throttled progress_callback(current, total, tournament_name) for the
+    recalculation engines.
+    
+    Every Streamlit element update is a websocket message, so the bar is only
+    redrawn when the whole percentage changes and the status text roughly
+    ``text_updates`` times per run (plus the final item).
+    
+    Args:
+        progress_bar: st.progress element
+        progress_text: st.empty placeholder for the status line
+        label: Status prefix, e.g. "TrueSkill" -> "TrueSkill: 12/340 - Event"
+        text_updates: Approximate number of status text updates per run
+        status_format: Status line template ({label}, {current}, {total}, {name})
+        empty_message: If set, shown with a full bar when called with total == 0
+    """
+    last_pct = -1
+    
+    def callback(current, total, tournament_name):
+        nonlocal last_pct
+        if total <= 0:
+            if empty_message:
+                progress_bar.progress(100)
+                progress_text.text(empty_message)
+            return
+        progress_pct = int((current / total) * 100)
+        if progress_pct != last_pct:
+            progress_bar.progress(progress_pct)
+            last_pct = progress_pct
+        if current == total or current % max(1, total // text_updates) == 0:
+            progress_text.text(status_format.format(label=label, current=current, total=total, name=tournament_name))
+    
+    return callback
 
 def initialize_engine():
     if 'engine' not in st.session_state:
@@ -576,12 +1104,12 @@ def seed_initial_data_if_empty():
     if st.session_state.seeding_attempted:
         return
     
-    tournaments = st.session_state.db.get_all_tournaments()
+    has_tournaments = st.session_state.db.has_tournaments()
     
     # Check if data needs to be reloaded (empty DB or version changed)
     reload_needed = needs_data_reload()
     
-    if len(tournaments) == 0 or reload_needed:
+    if not has_tournaments or reload_needed:
         st.session_state.seeding_attempted = True
         
         try:
@@ -589,7 +1117,7 @@ def seed_initial_data_if_empty():
             progress_bar = st.progress(0)
             progress_text = st.empty()
             
-            if reload_needed and len(tournaments) > 0:
+            if reload_needed and has_tournaments:
                 progress_text.text(f"🔄 Data version {DATA_VERSION} detected - reloading from JSON files...")
             else:
                 progress_text.text("🔄 Loading data from JSON files...")
@@ -615,14 +1143,8 @@ def seed_initial_data_if_empty():
             # Legacy code below - kept for reference but not executed
             df = load_initial_data()
             
-            def update_init_progress(current, total, tournament_name):
-                if total == 0:
-                    progress_bar.progress(100)
-                    progress_text.text("⚠️ No tournaments found in data file")
-                    return
-                progress_pct = int((current / total) * 100)
-                progress_bar.progress(progress_pct)
-                progress_text.text(f"Initializing database: {current}/{total} tournaments - {tournament_name}")
+            update_init_progress = make_progress_callback(progress_bar, progress_text, "Initializing database",
+                                                          empty_message="⚠️ No tournaments found in data file")
             
             processed, skipped = process_tournament_data(df, st.session_state.engine, progress_callback=update_init_progress)
             
@@ -637,11 +1159,7 @@ def seed_initial_data_if_empty():
                 recalc_progress_bar = st.progress(0)
                 recalc_progress_text = st.empty()
                 
-                def update_recalc_progress(current, total, tournament_name):
-                    if total > 0:
-                        progress_pct = int((current / total) * 100)
-                        recalc_progress_bar.progress(progress_pct)
-                        recalc_progress_text.text(f"TrueSkill: {current}/{total} - {tournament_name}")
+                update_recalc_progress = make_progress_callback(recalc_progress_bar, recalc_progress_text, "TrueSkill")
                 
                 result = st.session_state.engine.recalculate_all_ratings(progress_callback=update_recalc_progress)
                 
@@ -654,11 +1172,7 @@ def seed_initial_data_if_empty():
                         points_progress_bar = st.progress(0)
                         points_progress_text = st.empty()
                         
-                        def update_points_progress(current, total, tournament_name):
-                            if total > 0:
-                                progress_pct = int((current / total) * 100)
-                                points_progress_bar.progress(progress_pct)
-                                points_progress_text.text(f"Season Points: {current}/{total} - {tournament_name}")
+                        update_points_progress = make_progress_callback(points_progress_bar, points_progress_text, "Season Points")
                         
                         try:
                             st.session_state.points_engine.recalculate_all(progress_callback=update_points_progress)
@@ -685,8 +1199,6 @@ def seed_initial_data_if_empty():
     else:
         st.session_state.seeding_attempted = True
 
-from process_tournament_data import process_tournament_data
-
 def main():
     initialize_engine()
     seed_initial_data_if_empty()
@@ -732,12 +1244,10 @@ def main():
             st.metric("Tournaments Processed", stats['tournament_count'])
             
             # Show last updated time (based on file modification or current time if just deployed)
-            import os
-            from datetime import datetime
             try:
                 # Use database file modification time as proxy for deployment time
                 mtime = os.path.getmtime('public_data.db')
-                last_updated = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M')
+                last_updated = datetime.datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M')
                 st.caption(f"Last Updated: {last_updated}")
             except:
                 pass
@@ -749,85 +1259,99 @@ def main():
     elif page == "🏆 Tournament Analysis":
         show_tournament_analysis()
     elif page == "🎲 Tier Prediction":
-        from views import tier_prediction
         tier_prediction.render()
     elif page == "🌟 Season Standings":
-        from views import season_standings
         season_standings.render()
     elif page == "📊 Event Points":
-        from views import event_points
         event_points.render()
     elif page == "🎯 Player Top 5":
-        from views import player_top_tournaments
         player_top_tournaments.render()
     elif page == "📈 FSI Trends":
-        from views import fsi_trends
         fsi_trends.render()
     elif page == "⚙️ System Parameters":
-        from views import system_parameters
         system_parameters.render()
     elif page == "📅 Tournament Sequence":
-        from views import tournament_sequence
         tournament_sequence.render()
     elif page == "---":
         st.info("Please select a page from the sidebar.")
 
+_GUIDE_PATH = "NCA_Ranking_System_Technical_Guide.md"
+_MARKDOWN_IMAGE_RE = re.compile(r'!\[[^\]]*]\([^)]*\)')
+
+@st.cache_resource
+def _load_technical_guide(mtime):
+    """
+    Read and split the technical guide once per file version (keyed by mtime).
+    
+    Returns:
+        Tuple of (raw_bytes, intro_markdown, [(section_title, section_content), ...]).
+        Inline image links are stripped; the page renders them with st.image.
+    """
+    with open(_GUIDE_PATH, "rb") as f:
+        raw_bytes = f.read()
+    
+    sections = raw_bytes.decode("utf-8").split('\n## ')
+    parsed_sections = []
+    for section in sections[1:]:
+        section_title, _, section_content = section.partition('\n')
+        parsed_sections.append((section_title, _MARKDOWN_IMAGE_RE.sub('', section_content)))
+    
+    return raw_bytes, sections[0], parsed_sections
+
 def show_technical_guide():
     st.header("📄 NCA Ranking System: Technical Guide")
     st.markdown("*Understanding the Dual Ranking System with Linder Wendt as Example*")
     
+    raw_bytes, intro, sections = _load_technical_guide(pathlib.Path(_GUIDE_PATH).stat().st_mtime)
+    
     col1, col2 = st.columns([3, 1])
     with col2:
-        with open("NCA_Ranking_System_Technical_Guide.md", "rb") as file:
-            st.download_button(
-                label="📥 Download as Markdown",
-                data=file,
-                file_name="NCA_Ranking_System_Technical_Guide.md",
-                mime="text/markdown",
-                help="Download the complete guide as a markdown file"
-            )
+        st.download_button(
+            label="📥 Download as Markdown",
+            data=raw_bytes,
+            file_name="NCA_Ranking_System_Technical_Guide.md",
+            mime="text/markdown",
+            help="Download the complete guide as a markdown file"
+        )
     
     st.divider()
     
-    with open("NCA_Ranking_System_Technical_Guide.md", "r") as f:
-        content = f.read()
-    
-    sections = content.split('\n## ')
+    st.markdown(intro)
     
-    st.markdown(sections[0])
-    
-    for section in sections[1:]:
-        lines = section.split('\n')
-        section_title = lines[0]
-        section_content = '\n'.join(lines[1:])
-        
+    for section_title, section_content in sections:
         with st.expander(f"## {section_title}", expanded=(section_title == "System Overview")):
             if "TrueSkill Player Ratings" in section_title or "TrueSkill Player Rankings" in section_title:
                 st.image("attached_assets/generated_images/TrueSkill_rating_components_diagram_b71680be.png", 
                         caption="TrueSkill Rating Components")
-                section_content = section_content.replace(
-                    "![TrueSkill Components](attached_assets/generated_images/TrueSkill_rating_components_diagram_b71680be.png)",
-                    ""
-                )
             
             if "Field Strength Index" in section_title:
                 st.image("attached_assets/generated_images/FSI_calculation_comparison_diagram_2f012ec3.png",
                         caption="FSI Calculation: Singles vs Doubles")
-                section_content = section_content.replace(
-                    "![FSI Comparison](attached_assets/generated_images/FSI_calculation_comparison_diagram_2f012ec3.png)",
-                    ""
-                )
             
             if "Season Points System" in section_title:
                 st.image("attached_assets/generated_images/Season_points_distribution_curve_1e56fb1a.png",
                         caption="Season Points Distribution Curve")
-                section_content = section_content.replace(
-                    "![Points Distribution](attached_assets/generated_images/Season_points_distribution_curve_1e56fb1a.png)",
-                    ""
-                )
             
             st.markdown(section_content)
 
+_RATINGS_PAGE_SIZE = 100
+
+def _paginate_table(table, total_rows, page_size):
+    """
+    Return one page of a DataFrame or Arrow table, with a page picker shown when
+    there is more than one page. Arrow tables are sliced without copying.
+    """
+    if total_rows <= page_size:
+        return table
+    
+    page_count = -(-total_rows // page_size)
+    page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1, step=1)
+    start = (page - 1) * page_size
+    st.caption(f"Showing rows {start + 1}-{min(start + page_size, total_rows)} of {total_rows}")
+    if isinstance(table, pd.DataFrame):
+        return table.iloc[start:start + page_size]
+    return table.slice(start, page_size)
+
 def show_player_ratings():
     st.header("Player Ratings")
     
@@ -837,19 +1361,13 @@ def show_player_ratings():
         return
     
     # Tournament group filter
-    groups_df = get_cached_tournament_groups(st.session_state.data_cache_key)
-    tournament_groups = ['All'] + groups_df['tournament_group'].tolist() if len(groups_df) > 0 else ['All']
+    tournament_groups = ['All', *get_cached_tournament_groups(st.session_state.data_cache_key, get_db_version())]
     
     # === RATING MODEL SELECTOR ===
     st.markdown("### Rating Model View")
     
     # Get current active model for FSI from database
-    try:
-        active_model_sql = "SELECT rating_mode FROM system_parameters WHERE is_active = 1 LIMIT 1"
-        active_df = pd.read_sql(active_model_sql, db_engine)
-        active_model = active_df.iloc[0]['rating_mode'] if not active_df.empty and active_df.iloc[0]['rating_mode'] else 'singles_only'
-    except:
-        active_model = 'singles_only'
+    active_model = get_active_rating_mode()
     
     model_options = {
         'singles_only': 'Singles Only',
@@ -904,8 +1422,8 @@ def show_player_ratings():
     # Pass tournament group to rankings query (None if "All" is selected)
     filter_group = None if selected_group == 'All' else selected_group
     # Get latest DB version for cache invalidation
-    latest_db_update = get_latest_db_update()
-    rankings_df = get_cached_rankings(st.session_state.data_cache_key, latest_db_update, tournament_group=filter_group, rating_model=view_model)
+    db_version = get_db_version()
+    rankings_df = get_cached_rankings(st.session_state.data_cache_key, db_version, tournament_group=filter_group, rating_model=view_model)
     
     if len(rankings_df) == 0:
         st.info("Please load tournament data in the Data Management section to see ratings.")
@@ -940,22 +1458,25 @@ def show_player_ratings():
     
     st.divider()
     
-    # Apply search filter
+    # Apply search filter (plain substring match on cached lowercase names)
     if search_player:
-        filtered_df = rankings_df[rankings_df['player'].str.contains(search_player, case=False, na=False)]
+        player_names_lower = get_cached_player_search_index(st.session_state.data_cache_key, db_version, tournament_group=filter_group, rating_model=view_model)
+        filtered_df = rankings_df[np.char.find(player_names_lower, search_player.lower()) >= 0]
+        ratings_table = filtered_df
     else:
-        # Show all players (table will be scrollable)
+        # Show all players (table will be scrollable); the full grid is served
+        # from a cached Arrow table so it is not re-converted on every rerun
         filtered_df = rankings_df
+        ratings_table = get_cached_rankings_table(st.session_state.data_cache_key, db_version, tournament_group=filter_group, rating_model=view_model)
     
     st.subheader(f"Player Ratings ({len(filtered_df)} players shown)")
     
-    display_df = filtered_df.copy()
-    display_df['rating'] = display_df['rating'].round(2)
-    display_df['uncertainty'] = display_df['uncertainty'].round(2)
-    display_df['conservative_rating'] = display_df['conservative_rating'].round(2)
+    # Only the selected page of rows is sent to the browser
+    ratings_table = _paginate_table(ratings_table, len(filtered_df), _RATINGS_PAGE_SIZE)
     
+    # Values are already rounded in SQL, so the filtered frame is displayed as-is
     st.dataframe(
-        display_df,
+        ratings_table,
         width="stretch",
         hide_index=True,
         height=738,  # Fixed height for ~20 rows (20 * 35 + 38 header)
@@ -975,17 +1496,22 @@ def show_player_ratings():
         st.divider()
         st.subheader("Player Performance Analysis")
         
-        selected_player = st.selectbox("Select Player for Detailed View", rankings_df['player'].tolist())
+        player_choices = get_cached_player_choices(st.session_state.data_cache_key, db_version, tournament_group=filter_group, rating_model=view_model)
+        selected_player = st.selectbox("Select Player for Detailed View", player_choices)
         
         if selected_player:
             # Pass the selected rating model to get appropriate history
-            player_history = st.session_state.engine.get_player_history(selected_player, rating_model=view_model)
+            history_model = view_model
+            player_history = get_cached_player_history(st.session_state.data_cache_key, db_version, st.session_state.engine,
+                                                       selected_player, rating_model=history_model)
             
             # Show a note if no history available for this model
             if not player_history and view_model != 'singles_only':
                 st.info(f"No rating history found for '{model_options[view_model]}' model. This player may not have participated in {view_model.replace('_', ' ')} tournaments.")
                 # Fall back to singles history
-                player_history = st.session_state.engine.get_player_history(selected_player, rating_model='singles_only')
+                history_model = 'singles_only'
+                player_history = get_cached_player_history(st.session_state.data_cache_key, db_version, st.session_state.engine,
+                                                           selected_player, rating_model=history_model)
                 if player_history:
                     st.caption("Showing Singles Only history as fallback.")
             
@@ -996,140 +1522,8 @@ def show_player_ratings():
                     st.markdown(f"### {selected_player} - Rating History")
                     history_df = pd.DataFrame(player_history)
                     
-                    # Create tournament labels (tournament name + season on one line)
-                    tournament_labels = [f"{row['tournament']} S{row['season']}" 
-                                        for _, row in history_df.iterrows()]
-                    
-                    fig = go.Figure()
-                    
-                    # Trace 1: Revised Conservative Rating (Smoothed)
-                    fig.add_trace(go.Scatter(
-                        x=tournament_labels,
-                        y=history_df['conservative_rating'],
-                        mode='lines+markers',
-                        name='Revised Conservative (Smoothed)',
-                        line=dict(color='#1f77b4', width=3),
-                        hovertemplate='<b>Revised Cons.: %{y:.2f}</b><br><i>(Current estimate based on full history)</i><extra></extra>'
-                    ))
-                    
-                    # Trace 2: Forward Conservative Rating BEFORE tournament (no future info)
-                    # Shows the forward-only rating entering each tournament
-                    if ('before_mu_forward' in history_df.columns and 'before_sigma_forward' in history_df.columns
-                        and history_df['before_mu_forward'].notna().any() and history_df['before_sigma_forward'].notna().any()):
-                        # Calculate conservative rating from forward values: mu - 3*sigma
-                        before_cons_forward = history_df['before_mu_forward'] - 3 * history_df['before_sigma_forward']
-                        # Filter out extreme negative values (first tournament effect)
-                        before_cons_forward = before_cons_forward.where(before_cons_forward > -3.0)
-                        
-                        fig.add_trace(go.Scatter(
-                            x=tournament_labels,
-                            y=before_cons_forward,
-                            mode='lines+markers',
-                            name='BEFORE Tournament (Forward)',
-                            line=dict(color='#d62728', width=2, dash='dash'),
-                            connectgaps=True,
-                            hovertemplate='<b>Before: %{y:.2f}</b><br><i>(Rating ENTERING - no future info)</i><extra></extra>'
-                        ))
-                    else:
-                        # Fall back to backward-smoothed if forward not available
-                        fig.add_trace(go.Scatter(
-                            x=tournament_labels,
-                            y=history_df['conservative_rating_before'],
-                            mode='lines+markers',
-                            name='BEFORE Tournament (Smoothed)',
-                            line=dict(color='#d62728', width=2, dash='dash'),
-                            hovertemplate='<b>Before: %{y:.2f}</b><br><i>(Rating ENTERING - backward smoothed)</i><extra></extra>'
-                        ))
-                    
-                    # Trace 3: Mu (Mean Rating)
-                    fig.add_trace(go.Scatter(
-                        x=tournament_labels,
-                        y=history_df['after_mu'],
-                        mode='lines+markers',
-                        name='Mean Rating (μ)',
-                        line=dict(color='#ff7f0e', width=2, dash='dot'),
-                        hovertemplate='<b>Mean Rating: %{y:.2f}</b><br><i>(Raw skill estimate without uncertainty penalty)</i><extra></extra>'
-                    ))
-                    
-                    # Trace 4: Forward-Only Conservative Rating (if available) - AFTER tournament
-                    # Skip extreme first-tournament values (typically very negative due to high initial uncertainty)
-                    if 'conservative_rating_forward' in history_df.columns and history_df['conservative_rating_forward'].notna().any():
-                        forward_values = history_df['conservative_rating_forward'].copy()
-                        
-                        # Filter out extreme negative values (first tournament effect)
-                        # Set values below -3 (3 sigma below 0 mean) to NaN
-                        forward_values = forward_values.where(forward_values > -3.0)
-                        
-                        fig.add_trace(go.Scatter(
-                            x=tournament_labels,
-                            y=forward_values,
-                            mode='lines+markers',
-                            name='AFTER Tournament (Forward)',
-                            line=dict(color='#2ca02c', width=2, dash='dashdot'),
-                            connectgaps=True,
-                            hovertemplate='<b>After: %{y:.2f}</b><br><i>(Rating AFTER this tournament - no future info)</i><extra></extra>'
-                        ))
-                    
-                    # Calculate Y-axis range to prevent micro-movements from looking huge
-                    # Exclude extreme forward values from range calculation
-                    y_values_list = [history_df['conservative_rating'], history_df['after_mu']]
-                    if 'conservative_rating_forward' in history_df.columns:
-                        # Only include forward values above -3 (filters out extreme first-tournament values)
-                        filtered_forward = history_df['conservative_rating_forward'][history_df['conservative_rating_forward'] > -3.0]
-                        if len(filtered_forward) > 0:
-                            y_values_list.append(filtered_forward)
-                    if ('before_mu_forward' in history_df.columns and 'before_sigma_forward' in history_df.columns
-                        and history_df['before_mu_forward'].notna().any() and history_df['before_sigma_forward'].notna().any()):
-                        before_cons_fwd = history_df['before_mu_forward'] - 3 * history_df['before_sigma_forward']
-                        filtered_before_fwd = before_cons_fwd[(before_cons_fwd > -3.0) & before_cons_fwd.notna()]
-                        if len(filtered_before_fwd) > 0:
-                            y_values_list.append(filtered_before_fwd)
-                    all_y_values = pd.concat(y_values_list)
-                    y_min = all_y_values.min()
-                    y_max = all_y_values.max()
-                    y_range = y_max - y_min
-                    
-                    # Enforce a minimum range of 0.5
-                    min_range = 0.5
-                    if y_range < min_range:
-                        midpoint = (y_max + y_min) / 2
-                        y_axis_range = [midpoint - (min_range / 2), midpoint + (min_range / 2)]
-                    else:
-                        # Add a little padding (5%) so points aren't on the edge
-                        padding = y_range * 0.05
-                        y_axis_range = [y_min - padding, y_max + padding]
-
-                    fig.update_layout(
-                        title=dict(
-                            text="<b>Live vs. Revised Conservative Rating</b>",
-                            x=0.05,
-                            xanchor='left'
-                        ),
-                        xaxis_title="Tournament",
-                        yaxis_title="Conservative Rating (μ - 3σ)",
-                        hovermode='x unified',
-                        height=500,
-                        legend=dict(
-                            orientation="h",
-                            yanchor="bottom",
-                            y=1.02,
-                            xanchor="right",
-                            x=1
-                        ),
-                        xaxis=dict(
-                            tickfont=dict(size=9),
-                            tickangle=90,
-                            showgrid=True,
-                            gridcolor='lightgray',
-                            gridwidth=1
-                        ),
-                        yaxis=dict(
-                            showgrid=True,
-                            gridcolor='lightgray',
-                            range=y_axis_range
-                        ),
-                        margin=dict(t=80)  # Add margin for title/legend
-                    )
+                    fig = get_cached_player_history_figure(st.session_state.data_cache_key, db_version, st.session_state.engine,
+                                                           selected_player, rating_model=history_model)
                     
                     st.plotly_chart(fig, width="stretch")
                     
@@ -1158,11 +1552,15 @@ def show_player_ratings():
                                                  'after_mu', 'after_sigma', 
                                                  'conservative_rating_before', 'conservative_rating']].copy()
                     
-                    # Sort by date descending (most recent first)
+                    # Parse dates once, then sort by date descending (most recent first)
+                    display_history['tournament_date'] = pd.to_datetime(display_history['tournament_date'])
                     display_history = display_history.sort_values('tournament_date', ascending=False)
                     
                     # Format date as YYYY-MM
-                    display_history['date'] = pd.to_datetime(display_history['tournament_date']).dt.strftime('%Y-%m')
+                    # (truncating to datetime64[M] formats as YYYY-MM without a per-row strftime)
+                    tournament_dates = display_history['tournament_date']
+                    tournament_months = tournament_dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[M]').astype(str)
+                    display_history['date'] = pd.Series(tournament_months, index=display_history.index).where(tournament_dates.notna())
                     
                     # Calculate Delta on Conservative Rating (Event Delta)
                     display_history['delta_cons'] = display_history['conservative_rating'] - display_history['conservative_rating_before']
@@ -1170,8 +1568,8 @@ def show_player_ratings():
                     # Convert to numeric and round (handle any string/None values)
                     cols_to_round = ['after_mu', 'after_sigma', 
                                     'conservative_rating_before', 'conservative_rating', 'delta_cons']
-                    for col in cols_to_round:
-                        display_history[col] = pd.to_numeric(display_history[col], errors='coerce').round(2)
+                    rating_values = display_history[cols_to_round].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+                    display_history[cols_to_round] = np.round(rating_values, 2)
                     
                     # Rename columns with clear labels
                     display_history = display_history.rename(columns={
@@ -1192,7 +1590,7 @@ def show_player_ratings():
                                                        'Cons. In', 'Cons. Out', 'Δ']]
                     
                     st.dataframe(
-                        display_history, 
+                        _shrink_for_display(display_history), 
                         width="stretch", 
                         hide_index=True,
                         column_config={
@@ -1226,7 +1624,7 @@ def show_player_ratings():
     st.divider()
     
     st.subheader("Export Data")
-    csv = rankings_df.to_csv(index=False)
+    csv = get_cached_rankings_csv(st.session_state.data_cache_key, db_version, tournament_group=filter_group, rating_model=view_model)
     st.download_button(
         label="📥 Download Ratings CSV",
         data=csv,
@@ -1237,14 +1635,12 @@ def show_player_ratings():
 def show_tournament_analysis():
     st.header("Tournament Analysis")
     
-    tournaments = st.session_state.db.get_all_tournaments()
-    if len(tournaments) == 0:
+    if get_tournament_count() == 0:
         st.info("Please load tournament data in the Data Management section to see analysis.")
         return
     
     # Tournament group filter
-    groups_df = get_cached_tournament_groups(st.session_state.data_cache_key)
-    tournament_groups = ['All'] + groups_df['tournament_group'].tolist() if len(groups_df) > 0 else ['All']
+    tournament_groups = ['All', *get_cached_tournament_groups(st.session_state.data_cache_key, get_db_version())]
     
     col1, col2 = st.columns(2)
     with col1:
@@ -1252,32 +1648,14 @@ def show_tournament_analysis():
     with col2:
         selected_type = st.selectbox("Tournament Type Filter", ['All', 'Singles', 'Doubles'], index=0, key="tournament_analysis_type")
     
-    # Get tournament strength data (now includes id, date, group, avg_rating_before, tournament_format)
-    tournament_df = st.session_state.engine.get_tournament_strength()
-    
-    # Get FSI data
-    fsi_df = get_cached_tournament_fsi(st.session_state.data_cache_key)
-    
-    # Merge FSI data if available
-    if not fsi_df.empty:
-        # Merge on id
-        tournament_df = pd.merge(tournament_df, fsi_df[['id', 'fsi', 'avg_top_mu']], on='id', how='left')
-    else:
-        tournament_df['fsi'] = 0.0
-        tournament_df['avg_top_mu'] = 0.0
-        
     # Get scaling factor
     scaling_factor = 6.0
     if 'points_engine' in st.session_state and st.session_state.points_engine:
         scaling_factor = st.session_state.points_engine.fsi_scaling_factor
     
-    # Calculate new metrics
-    # Handle NaN values for tournaments without FSI data
-    tournament_df['avg_top_mu'] = tournament_df['avg_top_mu'].fillna(0.0)
-    tournament_df['fsi'] = tournament_df['fsi'].fillna(0.0)
-    
-    tournament_df['fsi_raw'] = tournament_df['avg_top_mu'] / scaling_factor
-    tournament_df['fsi_all'] = tournament_df['avg_rating_before'] / scaling_factor
+    # Tournament strength merged with FSI (cached; the filters below don't affect it)
+    tournament_df = get_cached_tournament_strength(st.session_state.data_cache_key, get_db_version(),
+                                                   st.session_state.engine, scaling_factor)
     
     # Apply filters
     if selected_group != 'All':
@@ -1314,21 +1692,14 @@ def show_tournament_analysis():
     
     st.subheader("Tournament Strength Metrics")
     
-    display_tournament_df = tournament_df.copy()
-    display_tournament_df['avg_rating_before'] = pd.to_numeric(display_tournament_df['avg_rating_before'], errors='coerce').round(2)
-    display_tournament_df['avg_rating_after'] = pd.to_numeric(display_tournament_df['avg_rating_after'], errors='coerce').round(2)
-    
-    # Format date
-    display_tournament_df['tournament_date'] = pd.to_datetime(display_tournament_df['tournament_date']).dt.strftime('%Y-%m-%d')
-    
-    # Sort by date desc
-    display_tournament_df = display_tournament_df.sort_values('tournament_date', ascending=False)
+    # The cached frame is already sorted by date (desc) with formatted display columns
+    display_tournament_df = tournament_df[[
+        'tournament', 'season', 'date_display', 'tournament_group', 'tournament_format',
+        'num_players', 'avg_rating_display', 'avg_top_mu', 'fsi_raw', 'fsi'
+    ]].rename(columns={'date_display': 'tournament_date', 'avg_rating_display': 'avg_rating_before'})
     
     st.dataframe(
-        display_tournament_df[[
-            'tournament', 'season', 'tournament_date', 'tournament_group', 'tournament_format',
-            'num_players', 'avg_rating_before', 'avg_top_mu', 'fsi_raw', 'fsi'
-        ]],
+        _shrink_for_display(display_tournament_df),
         width="stretch",
         hide_index=True,
         height=1000, # Taller canvas (approx 30+ rows)
@@ -1353,8 +1724,7 @@ def show_tournament_analysis():
 def show_admin_section():
     st.header("Admin & Calculation Logs")
     
-    tournaments = st.session_state.db.get_all_tournaments()
-    if len(tournaments) == 0:
+    if get_tournament_count() == 0:
         st.info("Please load tournament data in the Data Management section to see logs.")
         return
     
@@ -1408,24 +1778,25 @@ def show_admin_section():
         
         st.subheader("Rating Changes")
         
-        changes_data = []
-        for player, changes in selected_log['rating_changes'].items():
-            changes_data.append({
-                'Player': player,
-                'Place': changes['place'],
-                'Before μ': round(changes['before_mu'], 2),
-                'After μ': round(changes['after_mu'], 2),
-                'Δμ': round(changes['mu_change'], 2),
-                'Before σ': round(changes['before_sigma'], 2),
-                'After σ': round(changes['after_sigma'], 2),
-                'Δσ': round(changes['sigma_change'], 2),
-                'Conservative Before': round(changes['conservative_rating_before'], 2),
-                'Conservative After': round(changes['conservative_rating_after'], 2)
-            })
-        
-        changes_df = pd.DataFrame(changes_data)
+        # One row per player straight from the dict-of-dicts, rounded as a block
+        changes_df = pd.DataFrame.from_dict(selected_log['rating_changes'], orient='index')
         
         if not changes_df.empty:
+            changes_df = changes_df.rename_axis('Player').reset_index()
+            rating_cols = ['before_mu', 'after_mu', 'mu_change', 'before_sigma', 'after_sigma', 'sigma_change',
+                           'conservative_rating_before', 'conservative_rating_after']
+            changes_df[rating_cols] = np.round(changes_df[rating_cols].to_numpy(dtype=float), 2)
+            changes_df = changes_df.rename(columns={
+                'place': 'Place',
+                'before_mu': 'Before μ',
+                'after_mu': 'After μ',
+                'mu_change': 'Δμ',
+                'before_sigma': 'Before σ',
+                'after_sigma': 'After σ',
+                'sigma_change': 'Δσ',
+                'conservative_rating_before': 'Conservative Before',
+                'conservative_rating_after': 'Conservative After'
+            })
             changes_df = changes_df.sort_values('Place')
             
             st.dataframe(changes_df, width="stretch", hide_index=True)
@@ -1433,10 +1804,16 @@ def show_admin_section():
             st.divider()
             
             st.subheader("Rating Change Visualization")
-            fig = px.scatter(changes_df, x='Place', y='Δμ', 
-                             hover_data=['Player', 'Before μ', 'After μ'],
-                             title="Rating Change vs Place",
-                             labels={'Δμ': 'Rating Change (mu)', 'Place': 'Tournament Place'})
+            fig = go.Figure(go.Scattergl(
+                x=changes_df['Place'],
+                y=changes_df['Δμ'],
+                mode='markers',
+                customdata=changes_df[['Player', 'Before μ', 'After μ']].to_numpy(dtype=object),
+                hovertemplate='Player: %{customdata[0]}<br>Tournament Place: %{x}<br>Rating Change (mu): %{y}'
+                              '<br>Before μ: %{customdata[1]:.2f}<br>After μ: %{customdata[2]:.2f}<extra></extra>'
+            ))
+            fig.update_layout(title="Rating Change vs Place",
+                              xaxis_title='Tournament Place', yaxis_title='Rating Change (mu)')
             fig.add_hline(y=0, line_dash="dash", line_color="gray")
             st.plotly_chart(fig, width="stretch")
         else:
@@ -1455,6 +1832,131 @@ def show_admin_section():
     else:
         st.warning("No calculation logs available.")
 
+@st.fragment
+def _render_export_column():
+    """Tournament export download; reruns on its own without rebuilding the other columns."""
+    csv_export, tournament_count, result_count = get_cached_tournament_export_csv(
+        st.session_state.data_cache_key, get_data_fingerprint(), st.session_state.db)
+    
+    if result_count > 0:
+        st.download_button(
+            label="📥 Export All Tournament Data",
+            data=csv_export,
+            file_name="nca_all_tournament_data.csv.gz",
+            mime="application/gzip",
+            help="Download all tournaments in import-ready format"
+        )
+        st.caption(f"📊 {tournament_count} tournaments, {result_count} results")
+    else:
+        st.warning("⚠️ No tournament data available to export")
+
+@st.fragment
+def _render_recalc_column():
+    """Recalculate-all controls; confirm/cancel toggles only rerun this fragment."""
+    st.markdown("### 🔄 Recalculate All Rankings")
+    st.info("""
+    **Use this button to recalculate all player ratings from scratch in chronological order.**
+    
+    This will:
+    - Reset all players to default rating (μ=25.0)
+    - Clear all rating history
+    - Reprocess ALL tournaments starting from the OLDEST
+    - Rebuild ratings chronologically
+    """)
+    
+    # Initialize confirmation state
+    if 'confirm_recalc_data_mgmt' not in st.session_state:
+        st.session_state.confirm_recalc_data_mgmt = False
+    
+    if not st.session_state.confirm_recalc_data_mgmt:
+        if st.button("🔄 Recalculate All Rankings", type="primary", width="stretch", key="recalc_main"):
+            st.session_state.confirm_recalc_data_mgmt = True
+            st.rerun(scope="fragment")
+    else:
+        st.warning("⚠️ This will recalculate ALL ratings from scratch. Continue?")
+        
+        col_confirm, col_cancel = st.columns([1, 1])
+        with col_confirm:
+            if st.button("✅ Yes, Recalculate", type="primary", key="recalc_confirm"):
+                st.session_state.confirm_recalc_data_mgmt = False
+                
+                # Both phases report through one status container and one progress bar
+                with st.status("🔄 Recalculating TrueSkill ratings...", expanded=True) as status:
+                    progress_bar = st.progress(0)
+                    progress_text = st.empty()
+                    
+                    update_recalc_progress = make_progress_callback(progress_bar, progress_text, "Recalculating",
+                                                                    status_format="{label} {current}/{total}: {name}",
+                                                                    empty_message="⚠️ No tournaments to recalculate")
+                    
+                    result = st.session_state.engine.recalculate_all_ratings(progress_callback=update_recalc_progress)
+                    
+                    if result['status'] == 'success':
+                        # Now calculate season points
+                        status.update(label="🏆 Calculating season points...")
+                        progress_bar.progress(0)
+                        
+                        update_points_progress = make_progress_callback(progress_bar, progress_text, "Calculating points",
+                                                                        status_format="{label} {current}/{total}: {name}",
+                                                                        empty_message="⚠️ No tournaments to calculate points")
+                        
+                        try:
+                            st.session_state.points_engine.recalculate_all(progress_callback=update_points_progress)
+                            status.update(label=f"✅ {result['message']} and calculated season points!", state="complete")
+                        except Exception as e:
+                            status.update(label="❌ Points calculation error", state="error")
+                            st.error(f"❌ Season points error: {str(e)}\n\nTrueSkill ratings completed successfully.")
+                    else:
+                        status.update(label=f"❌ {result['message']}", state="error")
+                
+                if result['status'] == 'success':
+                    # Reload engine from database to get fresh ratings
+                    st.session_state.engine.reload_from_db()
+                    invalidate_data_cache()
+                    st.cache_data.clear()  # Force clear all cached data
+                    st.rerun()
+        
+        with col_cancel:
+            if st.button("❌ Cancel", key="recalc_cancel"):
+                st.session_state.confirm_recalc_data_mgmt = False
+                st.rerun(scope="fragment")
+
+@st.fragment
+def _render_logs_column():
+    """Logs and strength CSV downloads for the Data Management page."""
+    # The logs and strength CSVs are only built once requested, not on every render
+    if 'prepare_logs_csv' not in st.session_state:
+        st.session_state.prepare_logs_csv = False
+    if 'prepare_strength_csv' not in st.session_state:
+        st.session_state.prepare_strength_csv = False
+    
+    if st.session_state.prepare_logs_csv:
+        csv = get_cached_calculation_logs_csv(st.session_state.data_cache_key, get_data_fingerprint(),
+                                              getattr(st.session_state.engine, 'version', 0), st.session_state.engine)
+        st.download_button(
+            label="📥 Download Complete Logs CSV",
+            data=csv,
+            file_name="nca_complete_calculation_logs.csv.gz",
+            mime="application/gzip"
+        )
+    elif st.button("📄 Prepare Complete Logs CSV", key="prepare_logs_csv_button"):
+        st.session_state.prepare_logs_csv = True
+        st.rerun(scope="fragment")
+    
+    if st.session_state.prepare_strength_csv:
+        csv_tournament = get_cached_tournament_strength_csv(st.session_state.data_cache_key, get_data_fingerprint(),
+                                                            getattr(st.session_state.engine, 'version', 0),
+                                                            st.session_state.engine)
+        st.download_button(
+            label="📥 Download Tournament Strength CSV",
+            data=csv_tournament,
+            file_name="nca_tournament_strength.csv.gz",
+            mime="application/gzip"
+        )
+    elif st.button("📄 Prepare Tournament Strength CSV", key="prepare_strength_csv_button"):
+        st.session_state.prepare_strength_csv = True
+        st.rerun(scope="fragment")
+
 def show_data_management():
     st.header("Data Management")
     
@@ -1475,22 +1977,27 @@ def show_data_management():
     - `sequence_order`: Manual sequence number (1, 2, 3...)
     """)
     
-    uploaded_file = st.file_uploader("Choose a CSV file", type="csv")
+    uploaded_file = st.file_uploader("Choose a CSV file", type=["csv", "gz"],
+                                     help="Gzipped CSV exports (.csv.gz) can be uploaded as-is")
     
     if uploaded_file is not None:
         try:
-            # Try multiple encodings to handle files from different sources
+            # Try multiple encodings to handle files from different sources.
+            # Decoding the bytes is enough to pick one, so the CSV is parsed only once.
             df = None
             encodings = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']
+            raw = uploaded_file.getvalue()
+            if uploaded_file.name.endswith('.gz'):
+                raw = gzip.decompress(raw)
             
             for encoding in encodings:
                 try:
-                    uploaded_file.seek(0)  # Reset file pointer
-                    # Force season column to be read as string to prevent float conversion
-                    df = pd.read_csv(uploaded_file, encoding=encoding, dtype={'season': str})
-                    break  # Success! Exit the loop
+                    raw.decode(encoding)
                 except UnicodeDecodeError:
                     continue  # Try next encoding
+                # Force season column to be read as string to prevent float conversion
+                df = pd.read_csv(io.BytesIO(raw), encoding=encoding, dtype={'season': str})
+                break  # Success! Exit the loop
             
             if df is None:
                 st.error("❌ Unable to read file. Please ensure it's a valid CSV file with UTF-8 or Latin-1 encoding.")
@@ -1498,14 +2005,13 @@ def show_data_management():
                 required_cols = ['season', 'event', 'tier', 'place', 'player']
                 if all(col in df.columns for col in required_cols):
                     # Check for empty season values
-                    empty_seasons = df['season'].isna() | (df['season'].astype(str).str.strip() == '')
+                    empty_seasons = df['season'].fillna('').astype('string').str.strip().eq('')
                     if empty_seasons.any():
                         empty_count = empty_seasons.sum()
                         st.error(f"❌ Found {empty_count} row(s) with empty season values. Please ensure all rows have a valid season.")
                         st.dataframe(df[empty_seasons][['season', 'event', 'player', 'place']].head(20), width="stretch")
                     else:
                         # Normalize season column to ensure consistent format (16.0 → "16")
-                        from db_service import normalize_season
                         df['season'] = df['season'].apply(normalize_season)
                         
                         st.success("✅ File format validated!")
@@ -1529,14 +2035,9 @@ def show_data_management():
                             progress_bar = st.progress(0)
                             progress_text = st.empty()
                             
-                            def update_progress(current, total, tournament_name):
-                                if total == 0:
-                                    progress_bar.progress(100)
-                                    progress_text.text("⚠️ No tournaments found in uploaded file")
-                                    return
-                                progress_pct = int((current / total) * 100)
-                                progress_bar.progress(progress_pct)
-                                progress_text.text(f"Processing tournament {current}/{total}: {tournament_name}")
+                            update_progress = make_progress_callback(progress_bar, progress_text, "Processing tournament",
+                                                                     status_format="{label} {current}/{total}: {name}",
+                                                                     empty_message="⚠️ No tournaments found in uploaded file")
                             
                             processed, skipped = process_tournament_data(df, st.session_state.engine, progress_callback=update_progress)
                             
@@ -1551,14 +2052,9 @@ def show_data_management():
                                 recalc_progress_bar = st.progress(0)
                                 recalc_progress_text = st.empty()
                                 
-                                def update_recalc_progress(current, total, tournament_name):
-                                    if total == 0:
-                                        recalc_progress_bar.progress(100)
-                                        recalc_progress_text.text("⚠️ No tournaments to recalculate")
-                                        return
-                                    progress_pct = int((current / total) * 100)
-                                    recalc_progress_bar.progress(progress_pct)
-                                    recalc_progress_text.text(f"Recalculating {current}/{total}: {tournament_name}")
+                                update_recalc_progress = make_progress_callback(recalc_progress_bar, recalc_progress_text, "Recalculating",
+                                                                                status_format="{label} {current}/{total}: {name}",
+                                                                                empty_message="⚠️ No tournaments to recalculate")
                                 
                                 result = st.session_state.engine.recalculate_all_ratings(progress_callback=update_recalc_progress)
                                 
@@ -1571,14 +2067,9 @@ def show_data_management():
                                     points_progress_bar = st.progress(0)
                                     points_progress_text = st.empty()
                                     
-                                    def update_points_progress(current, total, tournament_name):
-                                        if total == 0:
-                                            points_progress_bar.progress(100)
-                                            points_progress_text.text("⚠️ No tournaments to calculate points")
-                                            return
-                                        progress_pct = int((current / total) * 100)
-                                        points_progress_bar.progress(progress_pct)
-                                        points_progress_text.text(f"Calculating points {current}/{total}: {tournament_name}")
+                                    update_points_progress = make_progress_callback(points_progress_bar, points_progress_text, "Calculating points",
+                                                                                    status_format="{label} {current}/{total}: {name}",
+                                                                                    empty_message="⚠️ No tournaments to calculate points")
                                     
                                     try:
                                         st.session_state.points_engine.recalculate_all(progress_callback=update_points_progress)
@@ -1610,157 +2101,13 @@ def show_data_management():
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            tournaments = st.session_state.db.get_all_tournaments()
-            export_data = []
-            
-            for tournament in tournaments:
-                results = st.session_state.db.get_rating_changes_for_tournament(tournament.id)
-                for result in results:
-                    if result.player:
-                        export_data.append({
-                            'season': tournament.season,
-                            'event': tournament.event_name,
-                            'tier': tournament.tier,
-                            'place': result.place,
-                            'player': result.player.name,
-                            'tournament_date': tournament.tournament_date.strftime('%Y-%m-%d') if tournament.tournament_date else '',
-                            'sequence_order': tournament.sequence_order if tournament.sequence_order else ''
-                        })
-            
-            if len(export_data) > 0:
-                export_df = pd.DataFrame(export_data)
-                csv_export = export_df.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export All Tournament Data",
-                    data=csv_export,
-                    file_name="nca_all_tournament_data.csv",
-                    mime="text/csv",
-                    help="Download all tournaments in import-ready format"
-                )
-                st.caption(f"📊 {len(tournaments)} tournaments, {len(export_data)} results")
-            else:
-                st.warning("⚠️ No tournament data available to export")
+            _render_export_column()
         
         with col2:
-            st.markdown("### 🔄 Recalculate All Rankings")
-            st.info("""
-            **Use this button to recalculate all player ratings from scratch in chronological order.**
-            
-            This will:
-            - Reset all players to default rating (μ=25.0)
-            - Clear all rating history
-            - Reprocess ALL tournaments starting from the OLDEST
-            - Rebuild ratings chronologically
-            """)
-            
-            # Initialize confirmation state
-            if 'confirm_recalc_data_mgmt' not in st.session_state:
-                st.session_state.confirm_recalc_data_mgmt = False
-            
-            if not st.session_state.confirm_recalc_data_mgmt:
-                if st.button("🔄 Recalculate All Rankings", type="primary", width="stretch", key="recalc_main"):
-                    st.session_state.confirm_recalc_data_mgmt = True
-                    st.rerun()
-            else:
-                st.warning("⚠️ This will recalculate ALL ratings from scratch. Continue?")
-                
-                col_confirm, col_cancel = st.columns([1, 1])
-                with col_confirm:
-                    if st.button("✅ Yes, Recalculate", type="primary", key="recalc_confirm"):
-                        st.session_state.confirm_recalc_data_mgmt = False
-                        
-                        recalc_progress_bar = st.progress(0)
-                        recalc_progress_text = st.empty()
-                        
-                        def update_recalc_progress(current, total, tournament_name):
-                            if total == 0:
-                                recalc_progress_bar.progress(100)
-                                recalc_progress_text.text("⚠️ No tournaments to recalculate")
-                                return
-                            progress_pct = int((current / total) * 100)
-                            recalc_progress_bar.progress(progress_pct)
-                            recalc_progress_text.text(f"Recalculating {current}/{total}: {tournament_name}")
-                        
-                        result = st.session_state.engine.recalculate_all_ratings(progress_callback=update_recalc_progress)
-                        
-                        if result['status'] == 'success':
-                            recalc_progress_bar.progress(100)
-                            recalc_progress_text.text("✅ TrueSkill ratings complete!")
-                            
-                            # Now calculate season points
-                            st.info("🏆 Calculating season points...")
-                            points_progress_bar = st.progress(0)
-                            points_progress_text = st.empty()
-                            
-                            def update_points_progress(current, total, tournament_name):
-                                if total == 0:
-                                    points_progress_bar.progress(100)
-                                    points_progress_text.text("⚠️ No tournaments to calculate points")
-                                    return
-                                progress_pct = int((current / total) * 100)
-                                points_progress_bar.progress(progress_pct)
-                                points_progress_text.text(f"Calculating points {current}/{total}: {tournament_name}")
-                            
-                            try:
-                                st.session_state.points_engine.recalculate_all(progress_callback=update_points_progress)
-                                points_progress_bar.progress(100)
-                                points_progress_text.text("✅ Season points complete!")
-                                st.success(f"✅ {result['message']} and calculated season points!")
-                            except Exception as e:
-                                points_progress_text.text(f"❌ Points calculation error")
-                                st.error(f"❌ Season points error: {str(e)}\n\nTrueSkill ratings completed successfully.")
-                            
-                            # Reload engine from database to get fresh ratings
-                            st.session_state.engine.reload_from_db()
-                            invalidate_data_cache()
-                            st.cache_data.clear()  # Force clear all cached data
-                            st.rerun()
-                        else:
-                            st.error(f"❌ {result['message']}")
-                            
-                with col_cancel:
-                    if st.button("❌ Cancel", key="recalc_cancel"):
-                        st.session_state.confirm_recalc_data_mgmt = False
-                        st.rerun()
-        
-        with col3:
-            logs = st.session_state.engine.get_detailed_logs()
-            
-            all_changes = []
-            for log in logs:
-                for player, changes in log['rating_changes'].items():
-                    all_changes.append({
-                        'tournament': log['tournament'],
-                        'season': log['season'],
-                        'tier': log['tier'],
-                        'player': player,
-                        'place': changes['place'],
-                        'before_mu': changes['before_mu'],
-                        'after_mu': changes['after_mu'],
-                        'mu_change': changes['mu_change'],
-                        'before_sigma': changes['before_sigma'],
-                        'after_sigma': changes['after_sigma'],
-                        'sigma_change': changes['sigma_change']
-                    })
-            
-            logs_df = pd.DataFrame(all_changes)
-            csv = logs_df.to_csv(index=False)
-            st.download_button(
-                label="📥 Download Complete Logs CSV",
-                data=csv,
-                file_name="nca_complete_calculation_logs.csv",
-                mime="text/csv"
-            )
+            _render_recalc_column()
         
         with col3:
-            tournament_df = st.session_state.engine.get_tournament_strength()
-            csv_tournament = tournament_df.to_csv(index=False)
-            st.download_button(
-                label="📥 Download Tournament Strength CSV",
-                data=csv_tournament,
-                file_name="nca_tournament_strength.csv",
-                mime="text/csv"
-            )
+            _render_logs_column()
     
     st.divider()
     
@@ -1982,11 +2329,10 @@ def show_parameter_tuning():
         return
     
     from database import get_db_session, PointsParameters
-    with get_db_session() as session:
-        points_params = session.query(PointsParameters).filter_by(is_active=1).first()
-        if not points_params:
-            st.error("No active points parameters found in database.")
-            return
+    points_params = get_cached_points_parameters(st.session_state.data_cache_key)
+    if not points_params:
+        st.error("No active points parameters found in database.")
+        return
     
     st.subheader("Current Season Points Parameters")
     
@@ -2196,7 +2542,7 @@ def show_parameter_tuning():
                 st.error("❌ All base points values must be positive!")
             else:
                 with st.spinner("Saving parameters and recalculating all season points..."):
-                    # Update parameters in database
+                    # Update parameters and recalculate on one session
                     with get_db_session() as session:
                         # Deactivate old params
                         session.query(PointsParameters).update({PointsParameters.is_active: 0})
@@ -2223,18 +2569,37 @@ def show_parameter_tuning():
                         )
                         session.add(new_params)
                         session.commit()
-                    
-                    # Reinitialize points engine with new parameters
-                    from points_engine_db import PointsEngineDB
-                    st.session_state.points_engine = PointsEngineDB(use_db_params=True)
-                    
-                    # Recalculate all points
-                    progress_placeholder = st.empty()
-                    def progress_callback(current, total, name):
-                        progress_placeholder.progress(current / total, text=f"Processing {current}/{total}: {name}")
-                    
-                    st.session_state.points_engine.recalculate_all(progress_callback=progress_callback)
-                    progress_placeholder.empty()
+                        
+                        # Apply the new parameters to the existing points engine
+                        st.session_state.points_engine.update_parameters(
+                            max_points=new_params.max_points,
+                            alpha=new_params.alpha,
+                            bonus_scale=new_params.bonus_scale,
+                            fsi_min=new_params.fsi_min,
+                            fsi_max=new_params.fsi_max,
+                            fsi_scaling_factor=new_params.fsi_scaling_factor,
+                            top_n_for_fsi=new_params.top_n_for_fsi,
+                            best_tournaments_per_season=new_params.best_tournaments_per_season,
+                            top_tier_fsi_threshold=new_params.top_tier_fsi_threshold,
+                            top_tier_base_points=new_params.top_tier_base_points,
+                            normal_tier_base_points=new_params.normal_tier_base_points,
+                            low_tier_base_points=new_params.low_tier_base_points,
+                            low_tier_fsi_threshold=new_params.low_tier_fsi_threshold,
+                            doubles_top_n_for_fsi=new_params.doubles_top_n_for_fsi,
+                            doubles_alpha=new_params.doubles_alpha,
+                            doubles_weight_high=new_params.doubles_weight_high
+                        )
+                        
+                        # Recalculate all points
+                        progress_placeholder = st.empty()
+                        def progress_callback(current, total, name):
+                            # Bar and text go out as one element update, about 100 times per run
+                            if total <= 0 or (current % max(1, total // 100) and current != total):
+                                return
+                            progress_placeholder.progress(current / total, text=f"Processing {current}/{total}: {name}")
+                        
+                        st.session_state.points_engine.recalculate_all(progress_callback=progress_callback, session=session)
+                        progress_placeholder.empty()
                     
                     st.success("✅ Parameters saved and season points recalculated successfully!")
                     invalidate_data_cache()
@@ -2243,6 +2608,208 @@ def show_parameter_tuning():
         except Exception as e:
             st.error(f"❌ Error: {str(e)}")
 
+# Tier rank, best first; shared by the geographic and skill-based tier columns
+TIER_ORDER = {"Major": 0, "Tier 1": 1, "Tier 2": 2, "Tier 3": 3, "Tier 4": 4, "Tier 5": 5}
+TIER_ORDER_SERIES = pd.Series(TIER_ORDER, dtype=np.int8)
+_ASSESSMENT_CATEGORIES = ["Overrated", "Correct", "Underrated"]
+
+@st.cache_data(ttl=600, show_spinner=False)
+def get_cached_tier_comparison(_cache_key, db_version):
+    """
+    Cache the geographic vs skill-based tier comparison, so filter changes on the
+    Tier Comparison page reuse it instead of re-aggregating every tournament field.
+    
+    Returns:
+        DataFrame with one row per tournament (fields of 4+ players), or an empty
+        DataFrame when there is not enough data
+    """
+    # Entering ratings for every tournament field in one query, aggregated per tournament
+    changes_df = _read_sql_raw("SELECT tournament_id, before_mu, before_sigma FROM rating_changes")
+    changes_df['conservative'] = changes_df['before_mu'] - 3 * changes_df['before_sigma']
+    field_size = changes_df.groupby('tournament_id').size()
+    changes_df = changes_df[changes_df['tournament_id'].map(field_size).to_numpy() >= 4]
+    
+    if len(changes_df) == 0:
+        return pd.DataFrame()
+    
+    by_tournament = changes_df.groupby('tournament_id')
+    field_stats = pd.DataFrame({
+        'avg_conservative': by_tournament['conservative'].mean(),
+        'avg_mu': by_tournament['before_mu'].mean(),
+    })
+    
+    # One lexsort lays each field out by conservative rating (ascending); the top 5 and the
+    # 75th percentile entry are then picked by position instead of re-sorting every field
+    tournament_ids = changes_df['tournament_id'].to_numpy()
+    conservative = changes_df['conservative'].to_numpy(dtype=float)
+    order = np.lexsort((conservative, tournament_ids))
+    conservative = conservative[order]
+    _, start, size = np.unique(tournament_ids[order], return_index=True, return_counts=True)
+    end = start + size
+    top_idx = end[:, None] - 5 + np.arange(5)  # Fields have at least 4 entries
+    top_vals = np.where(top_idx >= start[:, None], conservative[np.maximum(top_idx, 0)], np.nan)
+    field_stats['top_5_avg'] = np.nanmean(top_vals, axis=1)
+    field_stats['percentile_75'] = conservative[start + (0.75 * size).astype(int)]
+    field_stats['composite_score'] = (
+        field_stats['avg_conservative'] * 0.4 +
+        field_stats['top_5_avg'] * 0.3 +
+        field_stats['percentile_75'] * 0.2 +
+        field_stats['avg_mu'] * 0.1
+    )
+    
+    # Skill tier by composite score: >= 20 Major, >= 18 Tier 1, >= 15 Tier 2, >= 12 Tier 3,
+    # >= 9 Tier 4, else Tier 5 (NaN scores fall to Tier 5)
+    tier_cutoffs = np.array([9, 12, 15, 18, 20])
+    tier_labels = np.array(["Tier 5", "Tier 4", "Tier 3", "Tier 2", "Tier 1", "Major"])
+    scores = np.nan_to_num(field_stats['composite_score'].to_numpy(dtype=float), nan=-np.inf)
+    skill_idx = np.searchsorted(tier_cutoffs, scores, side='right')
+    field_stats['skill_tier'] = tier_labels[skill_idx]
+    # tier_labels runs Tier 5 -> Major, so the label index is the reversed TIER_ORDER rank
+    field_stats['skill_order'] = (len(tier_labels) - 1 - skill_idx).astype(np.int8)
+    
+    # Keep chronological tournament order
+    tournaments_df = get_cached_tournaments_chronological(_cache_key, db_version).rename(columns={
+        'event_name': 'Tournament',
+        'season': 'Season',
+        'tier': 'Geographic Tier',
+        'num_players': 'Field Size',
+        'avg_rating_before': 'Avg Rating',
+    })
+    comparison_df = tournaments_df.join(field_stats, on='id', how='inner')
+    
+    # Unknown geographic tiers rank below Tier 5, so they always read as Underrated
+    geo_order = comparison_df['Geographic Tier'].map(TIER_ORDER_SERIES).fillna(99).to_numpy(np.int8)
+    skill_order = comparison_df['skill_order'].to_numpy(np.int8)
+    # Three-valued, so stored as a categorical: the sign of the tier difference (-1/0/+1)
+    # is the category code, and filters and counts compare integer codes
+    comparison_df['Assessment'] = pd.Categorical.from_codes(
+        np.sign(geo_order - skill_order) + 1, categories=_ASSESSMENT_CATEGORIES
+    )
+    
+    comparison_df = comparison_df.rename(columns={'skill_tier': 'Skill-Based Tier', 'composite_score': 'Composite Score'})[[
+        'Tournament', 'Season', 'Geographic Tier', 'Skill-Based Tier', 'Field Size', 'Composite Score', 'Avg Rating', 'Assessment'
+    ]].reset_index(drop=True)
+    # Tiers are already assigned, so the narrower types only affect the table and chart payloads
+    return _shrink_for_display(comparison_df)
+
+_ASSESSMENT_COLORS = {
+    'Overrated': '#ff6666',
+    'Correct': '#6666ff',
+    'Underrated': '#66ff66'
+}
+
+@st.cache_resource(max_entries=8)
+def get_cached_assessment_pie(assessment_counts):
+    """
+    Cache the tier assessment pie per (assessment, count) tuple, so filter reruns
+    on the Tier Comparison page reuse the figure instead of rebuilding it.
+    """
+    names = [name for name, _ in assessment_counts]
+    return px.pie(
+        values=[count for _, count in assessment_counts],
+        names=names,
+        title='Tier Assessment Breakdown',
+        color=names,
+        color_discrete_map=_ASSESSMENT_COLORS
+    )
+
+@st.cache_resource(max_entries=8)
+def get_cached_tier_scatter(comparison_df):
+    """
+    Cache the composite score vs geographic tier scatter per comparison frame (hashed by content).
+    
+    Built from graph_objects with typed numpy arrays, which Plotly serializes as compact
+    binary arrays rather than per-value JSON numbers. Geographic tiers are plotted as
+    integer codes in tier order and labelled through the axis ticks.
+    """
+    geo_tiers = comparison_df['Geographic Tier']
+    extra_tiers = sorted(set(geo_tiers.dropna()) - set(TIER_ORDER))
+    geo = pd.Categorical(geo_tiers, categories=list(TIER_ORDER) + extra_tiers)
+    # Rows without a geographic tier have no y value and are left off the chart
+    plotted = geo.codes >= 0
+    
+    geo_codes = geo.codes.astype(np.int8)
+    scores = comparison_df['Composite Score'].to_numpy(np.float32)
+    # Field Size stays float when num_players is NULL. Plotly rejects NaN sizes and an
+    # int cast would turn them into invisible zero-size markers, so unknown sizes are
+    # drawn at the smallest known size and labelled "Unknown" in the hover text
+    field_sizes = comparison_df['Field Size']
+    known = field_sizes.notna().to_numpy()
+    sizes = field_sizes.to_numpy(np.float32, na_value=np.nan)
+    min_known = sizes[known].min() if known.any() else 1
+    sizes = np.where(known, sizes, min_known).astype(np.float32)
+    field_size_labels = np.where(known, np.round(np.nan_to_num(sizes)).astype(np.int64).astype(str), "Unknown")
+    customdata = np.column_stack([
+        comparison_df['Tournament'].to_numpy(object),
+        comparison_df['Season'].to_numpy(object),
+        geo_tiers.to_numpy(object),
+        field_size_labels.astype(object),
+    ])
+    assessment_codes = comparison_df['Assessment'].cat.codes.to_numpy()
+    
+    # Same marker scaling as px.scatter: marker area proportional to field size, 20px max
+    sizeref = 2.0 * sizes.max() / (20 ** 2) if len(sizes) else 1
+    
+    fig = go.Figure()
+    for code, assessment in enumerate(comparison_df['Assessment'].cat.categories):
+        mask = plotted & (assessment_codes == code)
+        if not mask.any():
+            continue
+        fig.add_trace(go.Scatter(
+            x=scores[mask],
+            y=geo_codes[mask],
+            mode='markers',
+            name=assessment,
+            legendgroup=assessment,
+            marker=dict(
+                size=sizes[mask], sizemode='area', sizeref=sizeref,
+                color=_ASSESSMENT_COLORS[assessment]
+            ),
+            customdata=customdata[mask],
+            hovertemplate=(
+                f"Assessment={assessment}<br>Composite Score=%{{x}}<br>Geographic Tier=%{{customdata[2]}}"
+                "<br>Field Size=%{customdata[3]}<br>Tournament=%{customdata[0]}<br>Season=%{customdata[1]}<extra></extra>"
+            ),
+        ))
+    
+    fig.update_layout(
+        title='Composite Score by Geographic Tier',
+        xaxis_title='Composite Score',
+        yaxis=dict(
+            title='Geographic Tier',
+            tickmode='array',
+            tickvals=np.arange(len(geo.categories), dtype=np.int8),
+            ticktext=list(geo.categories),
+        ),
+        legend=dict(title='Assessment', itemsizing='constant', tracegroupgap=0),
+    )
+    return fig
+
+@st.cache_resource(max_entries=8)
+def get_cached_tier_table_styler(comparison_df, assessment_filter):
+    """
+    Cache the filtered, row-colored comparison table per comparison frame (hashed by
+    content) and assessment filter, so unchanged reruns skip filtering and Styler setup.
+    """
+    if assessment_filter != "All":
+        filtered_df = comparison_df[comparison_df['Assessment'] == assessment_filter]
+    else:
+        filtered_df = comparison_df
+    
+    # Row colors by assessment, computed for the whole table at once
+    assessment = filtered_df['Assessment'].to_numpy()
+    row_colors = np.select([assessment == 'Overrated', assessment == 'Underrated'],
+                           ['background-color: #ffcccc', 'background-color: #ccffcc'],
+                           default='background-color: #e6f2ff')
+    
+    def highlight_assessment(df):
+        return pd.DataFrame(np.broadcast_to(row_colors[:, None], df.shape), index=df.index, columns=df.columns)
+    
+    return filtered_df.style.apply(highlight_assessment, axis=None).format({
+        'Composite Score': '{:.2f}',
+        'Avg Rating': '{:.2f}'
+    })
+
 def show_tier_comparison():
     st.header("Tier Comparison: Geographic vs Skill-Based")
     st.markdown("""
@@ -2250,106 +2817,34 @@ def show_tier_comparison():
     This analysis shows how tournament tiers would change if assigned based on actual field strength instead of location.
     """)
     
-    tournaments = st.session_state.db.get_all_tournaments()
-    if len(tournaments) == 0:
+    if get_tournament_count() == 0:
         st.info("Please load tournament data in the Data Management section to see tier comparison.")
         return
     
-    comparison_data = []
-    
-    for tournament in tournaments:
-        rating_changes = st.session_state.db.get_rating_changes_for_tournament(tournament.id)
-        
-        if len(rating_changes) == 0:
-            continue
-        
-        conservative_ratings = []
-        mu_ratings = []
-        
-        for rc in rating_changes:
-            conservative = rc.before_mu - 3 * rc.before_sigma
-            conservative_ratings.append(conservative)
-            mu_ratings.append(rc.before_mu)
-        
-        if len(conservative_ratings) < 4:
-            continue
-        
-        avg_conservative = sum(conservative_ratings) / len(conservative_ratings)
-        avg_mu = sum(mu_ratings) / len(mu_ratings)
-        
-        sorted_conservative = sorted(conservative_ratings, reverse=True)
-        top_5_count = min(5, len(sorted_conservative))
-        top_5_avg = sum(sorted_conservative[:top_5_count]) / top_5_count
-        
-        sorted_conservative_all = sorted(conservative_ratings)
-        percentile_75 = sorted_conservative_all[int(0.75 * len(sorted_conservative_all))] if len(sorted_conservative_all) > 0 else 0
-        
-        composite_score = (
-            avg_conservative * 0.4 +
-            top_5_avg * 0.3 +
-            percentile_75 * 0.2 +
-            avg_mu * 0.1
-        )
-        
-        if composite_score >= 20:
-            skill_tier = "Major"
-        elif composite_score >= 18:
-            skill_tier = "Tier 1"
-        elif composite_score >= 15:
-            skill_tier = "Tier 2"
-        elif composite_score >= 12:
-            skill_tier = "Tier 3"
-        elif composite_score >= 9:
-            skill_tier = "Tier 4"
-        else:
-            skill_tier = "Tier 5"
-        
-        geographic_tier = tournament.tier
-        
-        tier_order = {"Major": 0, "Tier 1": 1, "Tier 2": 2, "Tier 3": 3, "Tier 4": 4, "Tier 5": 5}
-        geo_order = tier_order.get(geographic_tier, 999)
-        skill_order = tier_order.get(skill_tier, 999)
-        
-        if geo_order < skill_order:
-            delta = "Overrated"
-        elif geo_order > skill_order:
-            delta = "Underrated"
-        else:
-            delta = "Correct"
-        
-        comparison_data.append({
-            'Tournament': tournament.event_name,
-            'Season': tournament.season,
-            'Geographic Tier': geographic_tier,
-            'Skill-Based Tier': skill_tier,
-            'Field Size': tournament.num_players,
-            'Composite Score': composite_score,
-            'Avg Rating': tournament.avg_rating_before,
-            'Assessment': delta
-        })
-    
-    if len(comparison_data) == 0:
+    comparison_df = get_cached_tier_comparison(st.session_state.data_cache_key, get_db_version())
+    if comparison_df.empty:
         st.warning("Not enough tournament data for comparison.")
         return
     
-    comparison_df = pd.DataFrame(comparison_data)
+    # One pass over the Assessment column feeds the metric cards and the pie chart
+    assessment_counts = comparison_df['Assessment'].value_counts()
+    overrated = int(assessment_counts.get('Overrated', 0))
+    correct = int(assessment_counts.get('Correct', 0))
+    underrated = int(assessment_counts.get('Underrated', 0))
     
     st.divider()
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        overrated = len(comparison_df[comparison_df['Assessment'] == 'Overrated'])
         st.metric("Overrated Tournaments", overrated, 
                  help="Tournaments assigned a higher tier than field strength suggests")
     
     with col2:
-        correct = len(comparison_df[comparison_df['Assessment'] == 'Correct'])
         st.metric("Correctly Rated", correct,
                  help="Tournaments where geographic tier matches skill-based tier")
     
     with col3:
-        underrated = len(comparison_df[comparison_df['Assessment'] == 'Underrated'])
         st.metric("Underrated Tournaments", underrated,
                  help="Tournaments assigned a lower tier than field strength suggests")
     
@@ -2362,25 +2857,7 @@ def show_tier_comparison():
         ["All", "Overrated", "Correct", "Underrated"]
     )
     
-    if assessment_filter != "All":
-        filtered_df = comparison_df[comparison_df['Assessment'] == assessment_filter]
-    else:
-        filtered_df = comparison_df
-    
-    def highlight_assessment(row):
-        if row['Assessment'] == 'Overrated':
-            return ['background-color: #ffcccc'] * len(row)
-        elif row['Assessment'] == 'Underrated':
-            return ['background-color: #ccffcc'] * len(row)
-        else:
-            return ['background-color: #e6f2ff'] * len(row)
-    
-    styled_df = filtered_df.style.apply(highlight_assessment, axis=1).format({
-        'Composite Score': '{:.2f}',
-        'Avg Rating': '{:.2f}'
-    })
-    
-    st.dataframe(styled_df, width="stretch", hide_index=True)
+    st.dataframe(get_cached_tier_table_styler(comparison_df, assessment_filter), width="stretch", hide_index=True)
     
     st.divider()
     
@@ -2390,36 +2867,13 @@ def show_tier_comparison():
     
     with col1:
         st.markdown("**Assessment Distribution**")
-        assessment_counts = comparison_df['Assessment'].value_counts()
-        fig_pie = px.pie(
-            values=assessment_counts.values,
-            names=assessment_counts.index,
-            title='Tier Assessment Breakdown',
-            color=assessment_counts.index,
-            color_discrete_map={
-                'Overrated': '#ff6666',
-                'Correct': '#6666ff',
-                'Underrated': '#66ff66'
-            }
-        )
+        # Categorical counts list every assessment; keep the pie to the ones present
+        fig_pie = get_cached_assessment_pie(tuple(assessment_counts[assessment_counts > 0].items()))
         st.plotly_chart(fig_pie, width="stretch")
     
     with col2:
         st.markdown("**Field Strength vs Geographic Tier**")
-        fig_scatter = px.scatter(
-            comparison_df,
-            x='Composite Score',
-            y='Geographic Tier',
-            size='Field Size',
-            color='Assessment',
-            hover_data=['Tournament', 'Season'],
-            title='Composite Score by Geographic Tier',
-            color_discrete_map={
-                'Overrated': '#ff6666',
-                'Correct': '#6666ff',
-                'Underrated': '#66ff66'
-            }
-        )
+        fig_scatter = get_cached_tier_scatter(comparison_df)
         st.plotly_chart(fig_scatter, width="stretch")
     
     st.divider()
@@ -2453,6 +2907,49 @@ def show_tier_comparison():
 
 
 
+@st.cache_resource(max_entries=8)
+def get_cached_sequence_table(_cache_key, db_version):
+    """
+    Cache the tournament sequence table as an Arrow table built column by column,
+    so st.dataframe skips its own pandas-to-Arrow conversion on each rerun. Dates
+    are pre-formatted strings. Falls back to a DataFrame when pyarrow is unavailable.
+    Bounded, since each data version would otherwise keep its own table.
+    """
+    tournaments = get_cached_tournaments_chronological(_cache_key, db_version)
+    sequence = tournaments['sequence_order']
+    columns = {
+        # Tournaments without a sequence number show their position in the list
+        'Seq': np.where(sequence.notna() & (sequence != 0), sequence.fillna(0),
+                        np.arange(1, len(tournaments) + 1)).astype(np.int64),
+        'ID': tournaments['id'].to_numpy(),
+        'Season': tournaments['season'],
+        'Event': tournaments['event_name'],
+        'Tier': tournaments['tier'],
+        'Players': tournaments['num_players'].to_numpy(),
+        'Date': tournaments['tournament_date'].dt.strftime('%Y-%m-%d').fillna('Not Set'),
+        'Created': tournaments['created_at'].dt.strftime('%Y-%m-%d %H:%M'),
+    }
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return pd.DataFrame(columns)
+    return pa.table({
+        name: pa.array(values, type=pa.string()) if name in ('Season', 'Event', 'Tier', 'Date', 'Created')
+        else pa.array(values)
+        for name, values in columns.items()
+    })
+
+@st.cache_data(show_spinner=False)
+def get_cached_tournament_options(_cache_key, db_version):
+    """Cache the (id, label) selectbox options for the sequencing page, rebuilt only after data changes."""
+    tournaments = get_cached_tournaments_chronological(_cache_key, db_version)
+    return tuple(
+        (t_id, f"{season} - {event_name} ({tier})")
+        for t_id, season, event_name, tier in zip(
+            tournaments['id'].tolist(), tournaments['season'].tolist(),
+            tournaments['event_name'].tolist(), tournaments['tier'].tolist())
+    )
+
 def show_tournament_sequencing():
     st.header("📅 Tournament Sequencing")
     
@@ -2461,7 +2958,7 @@ def show_tournament_sequencing():
     To ensure accurate rankings, tournaments must be processed in chronological order (the order they actually occurred).
     """)
     
-    tournaments = st.session_state.db.get_tournaments_chronological()
+    tournaments = get_cached_tournaments_chronological(st.session_state.data_cache_key, get_db_version())
     
     if len(tournaments) == 0:
         st.warning("No tournaments in database. Please load tournament data first.")
@@ -2469,21 +2966,12 @@ def show_tournament_sequencing():
     
     st.subheader(f"Current Tournament Sequence ({len(tournaments)} tournaments)")
     
-    tournament_data = []
-    for i, t in enumerate(tournaments, start=1):
-        tournament_data.append({
-            'Seq': t.sequence_order if t.sequence_order else i,
-            'ID': t.id,
-            'Season': t.season,
-            'Event': t.event_name,
-            'Tier': t.tier,
-            'Players': t.num_players,
-            'Date': t.tournament_date.strftime('%Y-%m-%d') if t.tournament_date else 'Not Set',
-            'Created': t.created_at.strftime('%Y-%m-%d %H:%M')
-        })
-    
-    df = pd.DataFrame(tournament_data)
-    st.dataframe(df, width="stretch", hide_index=True)
+    st.dataframe(get_cached_sequence_table(st.session_state.data_cache_key, get_db_version()),
+                 width="stretch", hide_index=True)
+    
+    # O(1) lookups for the selected tournament; both selectboxes share one cached options tuple
+    id_to_tournament = {t.id: t for t in tournaments.itertuples(index=False)}
+    tournament_options = get_cached_tournament_options(st.session_state.data_cache_key, get_db_version())
     
     st.divider()
     
@@ -2494,15 +2982,15 @@ def show_tournament_sequencing():
         
         selected_tournament = st.selectbox(
             "Select Tournament",
-            options=[(t.id, f"{t.season} - {t.event_name} ({t.tier})") for t in tournaments],
+            options=tournament_options,
             format_func=lambda x: x[1]
         )
         
         if selected_tournament:
             tournament_id = selected_tournament[0]
-            selected_t = next((t for t in tournaments if t.id == tournament_id), None)
+            selected_t = id_to_tournament.get(tournament_id)
             
-            current_date = selected_t.tournament_date if selected_t and selected_t.tournament_date else None
+            current_date = selected_t.tournament_date if selected_t and pd.notna(selected_t.tournament_date) else None
             
             new_date = st.date_input(
                 "Tournament Date",
@@ -2515,6 +3003,7 @@ def show_tournament_sequencing():
                     from datetime import datetime as dt_class
                     date_with_time = dt_class.combine(new_date, dt_class.min.time())
                     st.session_state.db.update_tournament_date(tournament_id, date_with_time)
+                    invalidate_data_cache()
                     st.success(f"✅ Date saved for {selected_tournament[1]}")
                     st.rerun()
                 else:
@@ -2527,16 +3016,16 @@ def show_tournament_sequencing():
         
         selected_tournament_seq = st.selectbox(
             "Select Tournament ",
-            options=[(t.id, f"{t.season} - {t.event_name} ({t.tier})") for t in tournaments],
+            options=tournament_options,
             format_func=lambda x: x[1],
             key="seq_select"
         )
         
         if selected_tournament_seq:
             tournament_id_seq = selected_tournament_seq[0]
-            selected_t_seq = next((t for t in tournaments if t.id == tournament_id_seq), None)
+            selected_t_seq = id_to_tournament.get(tournament_id_seq)
             
-            current_seq = selected_t_seq.sequence_order if selected_t_seq and selected_t_seq.sequence_order else 0
+            current_seq = int(selected_t_seq.sequence_order) if selected_t_seq and pd.notna(selected_t_seq.sequence_order) else 0
             
             new_seq = st.number_input(
                 "Sequence Order",
@@ -2548,6 +3037,7 @@ def show_tournament_sequencing():
             
             if st.button("💾 Save Sequence"):
                 st.session_state.db.update_tournament_sequence(tournament_id_seq, new_seq)
+                invalidate_data_cache()
                 st.success(f"✅ Sequence saved for {selected_tournament_seq[1]}")
                 st.rerun()
     
@@ -2560,6 +3050,7 @@ def show_tournament_sequencing():
     with col1:
         if st.button("🔄 Auto-Assign Sequence Numbers", help="Automatically assigns sequence 1, 2, 3... based on current date order"):
             st.session_state.db.auto_assign_tournament_sequence()
+            invalidate_data_cache()
             st.success("✅ Sequence numbers auto-assigned!")
             st.rerun()
     
@@ -2573,13 +3064,16 @@ def show_tournament_sequencing():
             col_a, col_b = st.columns([1, 1])
             with col_a:
                 if st.button("✅ Yes, Recalculate"):
-                    with st.spinner("Recalculating ratings in chronological order..."):
+                    with st.status("🔄 Recalculating ratings in chronological order...", expanded=True) as status:
                         from datetime import datetime
                         existing_tournaments = st.session_state.db.get_tournaments_chronological()
                         
+                        # One query for every tournament's results instead of one per tournament
+                        results_by_tournament = st.session_state.db.get_rating_changes_for_tournaments(
+                            [t.id for t in existing_tournaments])
+                        
                         tournament_data_list = []
                         for tournament in existing_tournaments:
-                            results = st.session_state.db.get_rating_changes_for_tournament(tournament.id)
                             tournament_data_list.append({
                                 'id': tournament.id,
                                 'season': tournament.season,
@@ -2587,48 +3081,63 @@ def show_tournament_sequencing():
                                 'tier': tournament.tier,
                                 'date': tournament.tournament_date,
                                 'sequence': tournament.sequence_order,
-                                'results': [(rc.player.name, rc.place) for rc in results if rc.player]
+                                'results': results_by_tournament.get(tournament.id, [])
                             })
                         
-                        # DEBUG: Log tournament metadata before sorting
-                        print("\n=== TOURNAMENTS BEFORE SORT ===")
-                        for t in tournament_data_list:
-                            print(f"{t['event']}: Date={t['date']}, ID={t['id']}")
+                        # DEBUG: Log tournament metadata before sorting. The message is only
+                        # built when debug logging is on, so normal runs skip the string work
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Tournaments before sort:\n%s", "\n".join(
+                                f"{t['event']}: Date={t['date']}, ID={t['id']}" for t in tournament_data_list))
                         
-                        # EXPLICIT PYTHON SORT: Force chronological order by tournament_date ONLY
-                        # Sort by: tournament_date (or max_date for NULL), then ID as tiebreaker
+                        # EXPLICIT SORT: Force chronological order by tournament_date ONLY
+                        # Sort by: tournament_date (or max_date for NULL), then ID as tiebreaker.
+                        # pandas sorts the keys; the dicts are reordered by position so None
+                        # dates/sequences stay None rather than becoming NaT/NaN
                         max_date = datetime(2099, 12, 31)
-                        tournament_data_list.sort(key=lambda t: (
-                            t['date'] if t['date'] else max_date,
-                            t['id']
-                        ))
+                        sort_keys = pd.DataFrame({
+                            'date': pd.to_datetime(pd.Series([t['date'] for t in tournament_data_list], dtype=object)),
+                            'id': [t['id'] for t in tournament_data_list]
+                        })
+                        sort_keys['date'] = sort_keys['date'].fillna(max_date)
+                        order = sort_keys.sort_values(['date', 'id'], kind='mergesort').index
+                        tournament_data_list = [tournament_data_list[i] for i in order]
                         
                         # DEBUG: Log tournament order after sorting
-                        print("\n=== TOURNAMENTS AFTER SORT (PROCESSING ORDER) ===")
-                        for i, t in enumerate(tournament_data_list, 1):
-                            print(f"{i}. {t['event']}: Date={t['date']}, ID={t['id']}")
-                        print()
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Tournaments after sort (processing order):\n%s", "\n".join(
+                                f"{i}. {t['event']}: Date={t['date']}, ID={t['id']}"
+                                for i, t in enumerate(tournament_data_list, 1)))
                         
                         st.session_state.db.clear_all_data()
                         
                         st.session_state.engine = TTTRankingEngine(use_db_params=True)
                         
+                        progress_bar = st.progress(0)
+                        progress_text = st.empty()
+                        # Status text is redrawn about 50 times over the run
+                        update_recalc_progress = make_progress_callback(
+                            progress_bar, progress_text, "Recalculating",
+                            text_updates=50,
+                            status_format="{label} {current}/{total}: {name}")
+                        
                         processed = 0
-                        for t_data in tournament_data_list:
-                            df_recalc = pd.DataFrame([
-                                {'player': player, 'place': place}
-                                for player, place in t_data['results']
-                            ])
+                        pending_updates = []
+                        for idx, t_data in enumerate(tournament_data_list, start=1):
+                            update_recalc_progress(idx, len(tournament_data_list), t_data['event'])
+                            # Results are already (player, place) tuples; no per-row dicts needed
+                            df_recalc = pd.DataFrame(t_data['results'], columns=['player', 'place'])
                             result = st.session_state.engine.process_tournament(
                                 df_recalc, t_data['event'], t_data['season'], t_data['tier']
                             )
                             if result['status'] == 'success':
-                                tournament = st.session_state.db.get_tournament_details(result['tournament_id'])
-                                if t_data['date']:
-                                    st.session_state.db.update_tournament_date(result['tournament_id'], t_data['date'])
-                                if t_data['sequence']:
-                                    st.session_state.db.update_tournament_sequence(result['tournament_id'], t_data['sequence'])
+                                pending_updates.append(
+                                    (result['tournament_id'], t_data['date'], t_data['sequence']))
                                 processed += 1
+                        
+                        # Restore dates and sequence numbers in one transaction
+                        st.session_state.db.bulk_update_tournament_metadata(pending_updates)
+                        status.update(label=f"✅ Recalculated {processed} tournaments", state="complete")
                     
                     st.success(f"✅ Recalculated {processed} tournaments in chronological order!")
                     invalidate_data_cache()
@@ -1,5 +1,6 @@
 import os
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, ForeignKey, Text
+from contextlib import nullcontext
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, ForeignKey, Text, Computed, Index
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
@@ -15,6 +16,9 @@ DATABASE_URL = f'sqlite:///{_DB_DIR}/public_data.db'
 
 engine = create_engine(
     DATABASE_URL,
+    pool_size=20,  # Concurrent cache misses across sessions share one pool
+    max_overflow=10,
+    pool_recycle=300,
     pool_pre_ping=True,
     connect_args={"check_same_thread": False}  # Needed for SQLite
 )
@@ -75,6 +79,18 @@ class Player(Base):
     singles_tournaments_played = Column(Integer, default=0)
     doubles_tournaments_played = Column(Integer, default=0)
     
+    # Stored conservative ratings (mu - 3*sigma) per model, indexed so rankings can
+    # ORDER BY a column instead of an expression. Falls back to the legacy mu/sigma.
+    conservative_rating_singles = Column(Float, Computed(
+        "COALESCE(current_rating_mu_singles, current_rating_mu) - 3 * COALESCE(current_rating_sigma_singles, current_rating_sigma)",
+        persisted=True), index=True)
+    conservative_rating_combined = Column(Float, Computed(
+        "COALESCE(current_rating_mu_combined, current_rating_mu) - 3 * COALESCE(current_rating_sigma_combined, current_rating_sigma)",
+        persisted=True), index=True)
+    conservative_rating_doubles = Column(Float, Computed(
+        "COALESCE(current_rating_mu_doubles, current_rating_mu) - 3 * COALESCE(current_rating_sigma_doubles, current_rating_sigma)",
+        persisted=True), index=True)
+    
     results = relationship("TournamentResult", back_populates="player")
     rating_history = relationship("RatingChange", back_populates="player")
 
@@ -97,6 +113,11 @@ class TournamentResult(Base):
     
     tournament = relationship("Tournament", back_populates="results")
     player = relationship("Player", back_populates="results")
+    
+    __table_args__ = (
+        # Covers the per-player EXISTS lookups used by the tournament-group filters
+        Index('ix_tournament_results_player_tournament', 'player_id', 'tournament_id'),
+    )
 
 class RatingChange(Base):
     __tablename__ = 'rating_changes'
@@ -226,6 +247,11 @@ class SeasonEventPoints(Base):
     
     tournament = relationship("Tournament")
     player = relationship("Player")
+    
+    __table_args__ = (
+        # Matches the season-standings window (PARTITION BY player, season ORDER BY points DESC)
+        Index('ix_season_event_points_player_season_points', 'player_id', 'season', total_points.desc()),
+    )
 
 class SeasonLeaderboard(Base):
     __tablename__ = 'season_leaderboards'
@@ -253,5 +279,8 @@ def get_db():
     finally:
         db.close()
 
-def get_db_session():
+def get_db_session(session=None):
+    # Reuse a caller's open session without closing it on exit
+    if session is not None:
+        return nullcontext(session)
     return SessionLocal()
@@ -3,7 +3,8 @@ from database import (
     RatingChange, SystemParameters, init_db, TournamentFSI,
     SeasonEventPoints, SeasonLeaderboard, PointsParameters
 )
-from sqlalchemy import desc, func
+from collections import defaultdict
+from sqlalchemy import desc, func, select, update
 from sqlalchemy.orm import joinedload
 from typing import List, Dict, Optional, Tuple
 import pandas as pd
@@ -252,6 +253,14 @@ class DatabaseService:
         """Get all tournaments in chronological order."""
         return self.get_tournaments_chronological()
     
+    def has_tournaments(self) -> bool:
+        """Check whether any tournament exists (SELECT EXISTS, no rows loaded)."""
+        db = get_db_session()
+        try:
+            return bool(db.query(db.query(Tournament.id).exists()).scalar())
+        finally:
+            db.close()
+    
     def get_tournament_details(self, tournament_id: int) -> Optional[Tournament]:
         db = get_db_session()
         try:
@@ -268,6 +277,50 @@ class DatabaseService:
         finally:
             db.close()
     
+    def get_rating_changes_for_tournaments(self, tournament_ids: List[int]) -> Dict[int, List[Tuple[str, int]]]:
+        """
+        Get (player_name, place) results for several tournaments in one joined query,
+        grouped by tournament id and ordered by place. Replaces one
+        get_rating_changes_for_tournament() call per tournament.
+        """
+        db = get_db_session()
+        try:
+            rows = db.execute(select(RatingChange.tournament_id, Player.name, RatingChange.place).join(
+                Player, RatingChange.player_id == Player.id
+            ).where(
+                RatingChange.tournament_id.in_(tournament_ids)
+            ).order_by(RatingChange.tournament_id, RatingChange.place, RatingChange.id)).all()
+            
+            results_by_tournament = defaultdict(list)
+            for tournament_id, player_name, place in rows:
+                results_by_tournament[tournament_id].append((player_name, place))
+            return results_by_tournament
+        finally:
+            db.close()
+    
+    def get_tournament_export_rows(self) -> List[Tuple[Tournament, int, str]]:
+        """
+        Get (tournament, place, player_name) for every rating change in one joined
+        query, in chronological tournament order then place. Used by the
+        tournament data export instead of one query per tournament.
+        """
+        db = get_db_session()
+        try:
+            # select() rather than db.query(): legacy Query de-duplicates rows that
+            # contain an entity, which would drop identical rows from other rating models
+            return db.execute(select(Tournament, RatingChange.place, Player.name).join(
+                RatingChange, RatingChange.tournament_id == Tournament.id
+            ).join(
+                Player, RatingChange.player_id == Player.id
+            ).order_by(
+                Tournament.sequence_order.asc().nullslast(),
+                Tournament.tournament_date.asc().nullslast(),
+                Tournament.id.asc(),
+                RatingChange.place.asc()
+            )).all()
+        finally:
+            db.close()
+    
     def get_all_rating_changes(self) -> List[RatingChange]:
         db = get_db_session()
         try:
@@ -537,6 +590,31 @@ class DatabaseService:
         finally:
             db.close()
     
+    def bulk_update_tournament_metadata(self, updates: List[Tuple[int, Optional[datetime], Optional[int]]]):
+        """
+        Update dates and sequence orders for many tournaments in one transaction.
+        
+        Args:
+            updates: (tournament_id, tournament_date, sequence_order) tuples. A missing
+                date or sequence leaves that column unchanged, matching
+                update_tournament_date/update_tournament_sequence being skipped.
+        """
+        date_rows = [{'id': t_id, 'tournament_date': date} for t_id, date, _ in updates if date]
+        sequence_rows = [{'id': t_id, 'sequence_order': seq} for t_id, _, seq in updates if seq]
+        if not date_rows and not sequence_rows:
+            return
+        
+        db = get_db_session()
+        try:
+            # ORM bulk UPDATE by primary key: one executemany per column list
+            if date_rows:
+                db.execute(update(Tournament), date_rows)
+            if sequence_rows:
+                db.execute(update(Tournament), sequence_rows)
+            db.commit()
+        finally:
+            db.close()
+    
     def get_tournaments_chronological(self) -> List[Tournament]:
         """Get tournaments in chronological order (by tournament_date, falling back to created_at)."""
         db = get_db_session()
@@ -6,6 +6,7 @@ import json
 import pandas as pd
 import pathlib
 from database import engine, Base, Tournament, Player, TournamentResult, RatingChange, TournamentFSI, SeasonEventPoints, SeasonLeaderboard, SystemParameters, PointsParameters
+from sqlalchemy import insert
 from sqlalchemy.orm import sessionmaker
 
 # Get the directory containing this file for reliable path resolution
@@ -36,8 +37,9 @@ def load_json_data():
         print("Loading players...")
         with open(_DATA_DIR / 'players.json', 'r', encoding='utf-8') as f:
             players_data = json.load(f)
+        player_rows = []
         for p in players_data:
-            player = Player(
+            player_rows.append(dict(
                 id=p['id'],
                 name=p['name'],
                 current_rating_mu=p.get('current_rating_mu', 0.0),
@@ -52,16 +54,18 @@ def load_json_data():
                 current_rating_sigma_doubles=p.get('current_rating_sigma_doubles'),
                 singles_tournaments_played=p.get('singles_tournaments_played', 0),
                 doubles_tournaments_played=p.get('doubles_tournaments_played', 0)
-            )
-            session.add(player)
+            ))
+        if player_rows:
+            session.execute(insert(Player), player_rows)
         session.commit()
         print(f"Loaded {len(players_data)} players")
         
         print("Loading tournaments...")
         with open(_DATA_DIR / 'tournaments.json', 'r', encoding='utf-8') as f:
             tournaments_data = json.load(f)
+        tournament_rows = []
         for t in tournaments_data:
-            tournament = Tournament(
+            tournament_rows.append(dict(
                 id=t['id'],
                 season=t['season'],
                 event_name=t['event_name'],
@@ -72,24 +76,27 @@ def load_json_data():
                 avg_rating_after=t.get('avg_rating_after'),
                 tournament_date=pd.to_datetime(t.get('tournament_date')) if t.get('tournament_date') else None,
                 sequence_order=t.get('sequence_order')
-            )
-            session.add(tournament)
+            ))
+        if tournament_rows:
+            session.execute(insert(Tournament), tournament_rows)
         session.commit()
         print(f"Loaded {len(tournaments_data)} tournaments")
         
         print("Loading FSI data...")
         with open(_DATA_DIR / 'fsi_trends.json', 'r', encoding='utf-8') as f:
             fsi_data = json.load(f)
+        # Tournament ID by (name, season), lowest ID first like the old per-row query's first()
+        tournament_ids = {}
+        for t in sorted(tournaments_data, key=lambda t: t['id']):
+            tournament_ids.setdefault((t['event_name'], str(t['season'])), t['id'])
+        
         # Group by tournament ID to avoid duplicates
         fsi_by_tournament = {}
         for f in fsi_data:
             # Find tournament ID by name and season
-            tournament = session.query(Tournament).filter_by(
-                event_name=f['event_name'],
-                season=f['season']
-            ).first()
-            if tournament and tournament.id not in fsi_by_tournament:
-                fsi_by_tournament[tournament.id] = f
+            tournament_id = tournament_ids.get((f['event_name'], str(f['season'])))
+            if tournament_id is not None and tournament_id not in fsi_by_tournament:
+                fsi_by_tournament[tournament_id] = f
         
         for tournament_id, f in fsi_by_tournament.items():
             fsi = TournamentFSI(
@@ -105,8 +112,9 @@ def load_json_data():
         print("Loading event points...")
         with open(_DATA_DIR / 'event_points.json', 'r', encoding='utf-8') as f:
             event_points_data = json.load(f)
+        event_point_rows = []
         for ep in event_points_data:
-            event_point = SeasonEventPoints(
+            event_point_rows.append(dict(
                 tournament_id=ep['tournament_id'],
                 player_id=ep['player_id'],
                 season=ep['season'],
@@ -124,8 +132,9 @@ def load_json_data():
                 overperformance=ep.get('overperformance', 0.0),
                 bonus_points=ep.get('bonus_points', 0.0),
                 total_points=ep.get('total_points', 0.0)
-            )
-            session.add(event_point)
+            ))
+        if event_point_rows:
+            session.execute(insert(SeasonEventPoints), event_point_rows)
         session.commit()
         print(f"Loaded {len(event_points_data)} event points")
         
@@ -137,6 +146,7 @@ def load_json_data():
         players = session.query(Player).all()
         player_name_to_id = {p.name: p.id for p in players}
         
+        standing_rows = []
         for s in standings_data:
             # Get player_id from player name if not present
             if 'player_id' not in s and 'player' in s:
@@ -146,15 +156,16 @@ def load_json_data():
             else:
                 player_id = s.get('player_id')
             
-            standing = SeasonLeaderboard(
+            standing_rows.append(dict(
                 season=s['season'],
                 player_id=player_id,
                 total_points=s['total_points'],
                 events_counted=s['events_counted'],
                 final_display_rating=s.get('final_display_rating', 0.0),
                 rank=s['rank']
-            )
-            session.add(standing)
+            ))
+        if standing_rows:
+            session.execute(insert(SeasonLeaderboard), standing_rows)
         session.commit()
         print(f"Loaded {len(standings_data)} season standings")
         
@@ -170,8 +181,9 @@ def load_json_data():
                 seen_ids.add(rc['id'])
                 unique_rating_changes.append(rc)
         
+        rating_change_rows = []
         for rc in unique_rating_changes:
-            rating_change = RatingChange(
+            rating_change_rows.append(dict(
                 id=rc['id'],
                 player_id=rc['player_id'],
                 tournament_id=rc['tournament_id'],
@@ -191,16 +203,18 @@ def load_json_data():
                 after_sigma_forward=rc.get('after_sigma_forward'),
                 conservative_rating_forward=rc.get('conservative_rating_forward'),
                 rating_model=rc.get('rating_model', 'singles_only')
-            )
-            session.add(rating_change)
+            ))
+        if rating_change_rows:
+            session.execute(insert(RatingChange), rating_change_rows)
         session.commit()
         print(f"Loaded {len(rating_changes_data)} rating changes")
         
         print("Loading tournament results...")
         with open(_DATA_DIR / 'tournament_results.json', 'r', encoding='utf-8') as f:
             results_data = json.load(f)
+        result_rows = []
         for r in results_data:
-            result = TournamentResult(
+            result_rows.append(dict(
                 id=r['id'],
                 tournament_id=r['tournament_id'],
                 player_id=r['player_id'],
@@ -208,8 +222,9 @@ def load_json_data():
                 before_mu=r.get('before_mu'),
                 before_sigma=r.get('before_sigma'),
                 team_key=r.get('team_key')
-            )
-            session.add(result)
+            ))
+        if result_rows:
+            session.execute(insert(TournamentResult), result_rows)
         session.commit()
         print(f"Loaded {len(results_data)} tournament results")
 
@@ -19,20 +19,21 @@ from database import (
     RatingChange,
     TournamentResult
 )
-from sqlalchemy import func
+from sqlalchemy import func, insert
 import json
 
 
 class PointsEngineDB:
-    def __init__(self, use_db_params=True):
+    def __init__(self, use_db_params=True, session=None):
         """
         Initialize the Points calculation engine.
         
         Args:
             use_db_params: If True, load parameters from database. If False, use defaults.
+            session: Optional open session to read parameters from instead of opening a new one
         """
         if use_db_params:
-            with get_db_session() as session:
+            with get_db_session(session) as session:
                 params = session.query(PointsParameters).filter_by(is_active=1).first()
                 if params:
                     self.max_points = params.max_points  # Legacy - not used in calculations
@@ -154,6 +155,29 @@ class PointsEngineDB:
                 self.doubles_alpha = params.doubles_alpha
                 self.doubles_weight_high = getattr(params, 'doubles_weight_high', 0.65)
     
+    def update_parameters(self, **params):
+        """
+        Update scoring parameters in place without reloading from the database.
+        
+        Args:
+            **params: Parameter attributes to set, e.g. alpha=1.4, top_n_for_fsi=20
+        """
+        unknown = [name for name in params if not hasattr(self, name)]
+        if unknown:
+            raise ValueError(f"Unknown points parameters: {', '.join(unknown)}")
+        
+        previous = {name: getattr(self, name) for name in params}
+        for name, value in params.items():
+            setattr(self, name, value)
+        
+        try:
+            self._validate_parameters()
+        except ValueError:
+            # Leave the engine on its previous, valid parameters
+            for name, value in previous.items():
+                setattr(self, name, value)
+            raise
+    
     def calculate_fsi(self, pre_event_ratings: Dict[int, Tuple[float, float]]) -> Tuple[float, float]:
         """
         Calculate Field Strength Index for a tournament.
@@ -544,15 +568,16 @@ class PointsEngineDB:
         # Flush to persist changes before processing
         session.flush()
     
-    def recalculate_all(self, progress_callback=None):
+    def recalculate_all(self, progress_callback=None, session=None):
         """
         Recalculate all points for all tournaments in chronological order.
         This is the main method that processes the entire database.
         
         Args:
             progress_callback: Optional function(current, total, tournament_name) for progress updates
+            session: Optional open session to reuse instead of opening a new one
         """
-        with get_db_session() as session:
+        with get_db_session(session) as session:
             # Clear existing points data
             session.query(SeasonEventPoints).delete()
             session.query(SeasonLeaderboard).delete()
@@ -571,6 +596,13 @@ class PointsEngineDB:
             # Preload all players for ID lookups
             all_players = {p.id: p.name for p in session.query(Player).all()}
             
+            # Preload singles results for every tournament in one query, in place order
+            results_by_tournament = {}
+            for result in session.query(RatingChange).order_by(
+                RatingChange.tournament_id, RatingChange.place.asc(), RatingChange.id
+            ):
+                results_by_tournament.setdefault(result.tournament_id, []).append(result)
+            
             # Track player ratings chronologically for doubles tournaments
             # This dict stores each player's rating snapshot as tournaments are processed
             player_rating_tracker = {}  # {player_id: (mu, sigma)}
@@ -589,9 +621,7 @@ class PointsEngineDB:
                 
                 # SINGLES PROCESSING: Use RatingChange records (existing logic)
                 # Get tournament results
-                results = session.query(RatingChange).filter_by(
-                    tournament_id=tournament.id
-                ).order_by(RatingChange.place.asc()).all()
+                results = results_by_tournament.get(tournament.id, [])
                 
                 if not results:
                     continue
@@ -624,8 +654,9 @@ class PointsEngineDB:
                                       reverse=True)
                 expected_ranks = {player_id: rank + 1 for rank, player_id in enumerate(sorted_players)}
                 
-                # Calculate points for each player
+                # Calculate points for each player, inserted as one batch per tournament
                 field_size = len(results)
+                event_point_rows = []
                 
                 for result in results:
                     player_id = result.player_id
@@ -641,29 +672,32 @@ class PointsEngineDB:
                     overperformance = expected_rank - place
                     
                     # Save event points
-                    event_points = SeasonEventPoints(
-                        tournament_id=tournament.id,
-                        player_id=player_id,
-                        season=tournament.season,
-                        place=place,
-                        field_size=field_size,
-                        pre_mu=result.before_mu,
-                        pre_sigma=result.before_sigma,
-                        post_mu=result.after_mu,
-                        post_sigma=result.after_sigma,
-                        display_rating=result.after_mu - 3 * result.after_sigma,
-                        fsi=fsi,
-                        raw_points=raw_points,
-                        base_points=base_points,
-                        expected_rank=expected_rank,
-                        overperformance=overperformance,
-                        bonus_points=bonus_points,
-                        total_points=total_points
-                    )
-                    session.add(event_points)
+                    event_point_rows.append({
+                        'tournament_id': tournament.id,
+                        'player_id': player_id,
+                        'season': tournament.season,
+                        'place': place,
+                        'field_size': field_size,
+                        'pre_mu': result.before_mu,
+                        'pre_sigma': result.before_sigma,
+                        'post_mu': result.after_mu,
+                        'post_sigma': result.after_sigma,
+                        'display_rating': result.after_mu - 3 * result.after_sigma,
+                        'fsi': fsi,
+                        'raw_points': raw_points,
+                        'base_points': base_points,
+                        'expected_rank': expected_rank,
+                        'overperformance': overperformance,
+                        'bonus_points': bonus_points,
+                        'total_points': total_points
+                    })
                     
                     # Track post-tournament rating for future doubles tournaments
                     player_rating_tracker[player_id] = (result.after_mu, result.after_sigma)
+                
+                # Flush pending doubles/FSI rows first so insertion order stays chronological
+                session.flush()
+                session.execute(insert(SeasonEventPoints), event_point_rows)
             
             # Commit all event points and FSI data
             session.commit()
@@ -22,6 +22,9 @@ class TTTRankingEngine:
         self.sigma = sigma
         self.beta = beta
         self.mu = 0.0 # TTT standard mean is 0
+        # Bumped after every successful recalculation; used as a cache key for
+        # exports derived from the engine's rating changes
+        self.version = 0
         
         # Load gamma from database if not specified
         if gamma is None and use_db_params:
@@ -228,6 +231,16 @@ class TTTRankingEngine:
             # Get learning curves (history of ratings)
             lc = history.learning_curves()
             
+            # Index each learning curve by time once, so the per-tournament lookups
+            # below are dict hits instead of a scan over the player's whole history
+            # {player_id_str: {time: index of first entry at that time}}
+            lc_time_index = {}
+            for p_id_str, player_history in lc.items():
+                time_index = {}
+                for h_idx, (time, _) in enumerate(player_history):
+                    time_index.setdefault(time, h_idx)
+                lc_time_index[p_id_str] = time_index
+            
             all_rating_changes = []
             player_final_ratings = {} # player_id -> (mu, sigma)
             
@@ -254,16 +267,21 @@ class TTTRankingEngine:
                     rating_before_smoothed = None
                     
                     # Find the rating at this time and the previous time
-                    for h_idx, (time, rating) in enumerate(player_history):
-                        if abs(time - target_time) < 0.001:
-                            rating_after = rating
-                            # Get the previous smoothed rating (before this tournament)
-                            if h_idx > 0:
-                                rating_before_smoothed = player_history[h_idx - 1][1]
-                            else:
-                                # First tournament, use initial rating
-                                rating_before_smoothed = rating  # or use default (0, 1.667)
-                            break
+                    match_idx = lc_time_index.get(p_id_str, {}).get(target_time)
+                    if match_idx is None:
+                        # Fall back to a tolerant scan if the time did not round-trip exactly
+                        for h_idx, (time, _) in enumerate(player_history):
+                            if abs(time - target_time) < 0.001:
+                                match_idx = h_idx
+                                break
+                    if match_idx is not None:
+                        rating_after = player_history[match_idx][1]
+                        # Get the previous smoothed rating (before this tournament)
+                        if match_idx > 0:
+                            rating_before_smoothed = player_history[match_idx - 1][1]
+                        else:
+                            # First tournament, use initial rating
+                            rating_before_smoothed = rating_after  # or use default (0, 1.667)
                     
                     if rating_after:
                         # Use SMOOTHED rating for before (not forward pass)
@@ -325,6 +343,7 @@ class TTTRankingEngine:
                     player.updated_at = datetime.utcnow()
             
             session.commit()
+            self.version += 1
             return {'status': 'success', 'message': 'TTT Recalculation Complete'}
             
         except Exception as e:
@@ -397,6 +416,51 @@ class TTTRankingEngine:
     def get_tournament_strength(self) -> pd.DataFrame:
         return self.db.get_tournaments_dataframe()
 
+    def get_flat_logs_df(self) -> pd.DataFrame:
+        """
+        Get every rating change as one flat row per tournament and player.
+        Same tournament order as get_detailed_logs(), without the nested dicts.
+        """
+        session = self.db.get_session()
+        try:
+            rows = session.query(
+                Tournament.id,
+                Tournament.event_name.label('tournament'),
+                Tournament.season,
+                Tournament.tier,
+                Player.name.label('player'),
+                RatingChange.place,
+                RatingChange.before_mu,
+                RatingChange.after_mu,
+                RatingChange.mu_change,
+                RatingChange.before_sigma,
+                RatingChange.after_sigma,
+                RatingChange.sigma_change,
+                RatingChange.conservative_rating_before,
+                RatingChange.conservative_rating_after
+            ).join(
+                RatingChange, RatingChange.tournament_id == Tournament.id
+            ).join(
+                Player, RatingChange.player_id == Player.id
+            ).order_by(
+                Tournament.sequence_order.desc().nullslast(),
+                Tournament.tournament_date.desc(),
+                RatingChange.id
+            ).all()
+            logs_df = pd.DataFrame(rows, columns=[
+                'tournament_id', 'tournament', 'season', 'tier', 'player', 'place',
+                'before_mu', 'after_mu', 'mu_change', 'before_sigma', 'after_sigma', 'sigma_change',
+                'conservative_rating_before', 'conservative_rating_after'
+            ])
+            # Like the per-player dicts in get_detailed_logs(), a player keeps the position of
+            # their first change in a tournament and the values of their latest one
+            keys = ['tournament_id', 'player']
+            logs_df['first_seen'] = logs_df.groupby(keys, sort=False).ngroup()
+            logs_df = logs_df.drop_duplicates(keys, keep='last').sort_values('first_seen', kind='stable')
+            return logs_df.drop(columns=['tournament_id', 'first_seen']).reset_index(drop=True)
+        finally:
+            session.close()
+
     def get_detailed_logs(self) -> List[Dict]:
         """
         Get detailed logs/summary of processed tournaments.
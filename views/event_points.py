@@ -1,7 +1,6 @@
 """Event Points Breakdown Page - Shows detailed points calculation for tournaments."""
 
 import streamlit as st
-import pandas as pd
 
 
 def render():
@@ -14,6 +13,7 @@ def render():
         get_cached_event_points,
         get_cached_team_info,
         get_cached_tournament_groups,
+        get_db_version,
         show_cache_freshness
     )
     
@@ -30,8 +30,7 @@ def render():
     show_cache_freshness()
     
     # Get tournament groups for filter
-    groups_df = get_cached_tournament_groups(cache_key)
-    tournament_groups = ['All'] + groups_df['tournament_group'].tolist() if len(groups_df) > 0 else ['All']
+    tournament_groups = ['All', *get_cached_tournament_groups(cache_key, get_db_version())]
     
     # Tournament group filter
     selected_group = st.selectbox("Tournament Group", tournament_groups, index=0, key="event_points_group")
@@ -44,13 +43,13 @@ def render():
         st.warning("⚠️ No tournament points data available. Please run recalculation from Data Management.")
         return
     
-    # Tournament selector
-    tournament_options = []
-    for idx, row in tournaments_df.iterrows():
-        format_str = str(row['tournament_format']).upper() if pd.notna(row['tournament_format']) else 'SINGLES'
-        tournament_options.append(
-            f"{row['event_name']} (Season {row['season']}) - {format_str} - FSI: {row['fsi']:.2f}"
-        )
+    # Tournament selector labels, built column-wise rather than row by row
+    formats = tournaments_df['tournament_format']
+    format_str = formats.astype(str).str.upper().where(formats.notna(), 'SINGLES')
+    tournament_options = (
+        tournaments_df['event_name'].astype(str) + ' (Season ' + tournaments_df['season'].astype(str)
+        + ') - ' + format_str + ' - FSI: ' + tournaments_df['fsi'].map('{:.2f}'.format)
+    ).tolist()
     tournament_ids = tournaments_df['id'].tolist()
     
     selected_idx = st.selectbox("Select Tournament", range(len(tournament_options)), 
@@ -60,7 +59,7 @@ def render():
     tournament_info = tournaments_df.iloc[selected_idx]
     
     # Get cached event points for selected tournament
-    event_points_df = get_cached_event_points(cache_key, tournament_id=tournament_id)
+    event_points_df = get_cached_event_points(cache_key, get_db_version(), tournament_id=tournament_id)
     
     if len(event_points_df) == 0:
         st.warning(f"⚠️ No points data available for this tournament")
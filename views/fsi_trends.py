@@ -13,9 +13,10 @@ def render():
     
     # Import cached functions from app.py
     from app import (
-        get_cached_points_by_place,
+        get_points_by_place,
         get_cached_tournament_fsi,
         get_cached_tournament_groups,
+        get_db_version,
         show_cache_freshness
     )
     
@@ -33,8 +34,7 @@ def render():
     show_cache_freshness()
     
     # Get tournament groups for filter
-    groups_df = get_cached_tournament_groups(cache_key)
-    tournament_groups = ['All'] + groups_df['tournament_group'].tolist() if len(groups_df) > 0 else ['All']
+    tournament_groups = ['All', *get_cached_tournament_groups(cache_key, get_db_version())]
     
     # ========== NEW SECTION: Points by Place Graph ==========
     st.divider()
@@ -46,7 +46,7 @@ def render():
     group_filter = None if selected_group_points == 'All' else selected_group_points
     
     # Get points data (cached with filter)
-    points_df = get_cached_points_by_place(cache_key, tournament_group=group_filter)
+    points_df = get_points_by_place(cache_key, get_db_version(), tournament_group=group_filter)
     
     if len(points_df) == 0:
         st.warning("⚠️ No points data available. Please run recalculation from Data Management.")
@@ -102,20 +102,26 @@ def render():
             # Create line graph
             fig = go.Figure()
             
-            # Group by tournament
+            # Group by tournament: one place-sorted groupby instead of a boolean scan per tournament,
+            # with lines added in order of first appearance as before
+            points_by_tournament = dict(tuple(
+                filtered_points.sort_values('place', kind='stable').groupby('tournament_id', sort=False)
+            ))
             for tournament_id in filtered_points['tournament_id'].unique():
-                tournament_data = filtered_points[filtered_points['tournament_id'] == tournament_id].sort_values('place')
+                tournament_data = points_by_tournament[tournament_id]
                 
-                # Create hover text
+                # Create hover text (the tournament header is the same for every place)
+                first = tournament_data.iloc[0]
+                header = (
+                    f"<b>{first['event_name']}</b><br>" +
+                    f"Season: {first['season']}<br>" +
+                    f"Format: {first['tournament_format'].upper()}<br>" +
+                    f"FSI: {first['fsi']:.3f}<br>" +
+                    f"Field Size: {first['field_size']}<br>"
+                )
                 hover_text = [
-                    f"<b>{tournament_data.iloc[0]['event_name']}</b><br>" +
-                    f"Season: {tournament_data.iloc[0]['season']}<br>" +
-                    f"Format: {tournament_data.iloc[0]['tournament_format'].upper()}<br>" +
-                    f"FSI: {tournament_data.iloc[0]['fsi']:.3f}<br>" +
-                    f"Field Size: {tournament_data.iloc[0]['field_size']}<br>" +
-                    f"Place: {row['place']}<br>" +
-                    f"Points: {row['total_points']:.2f}"
-                    for _, row in tournament_data.iterrows()
+                    header + f"Place: {place}<br>" + f"Points: {points:.2f}"
+                    for place, points in zip(tournament_data['place'].tolist(), tournament_data['total_points'].tolist())
                 ]
                 
                 # Add line for this tournament
@@ -123,7 +129,7 @@ def render():
                     x=tournament_data['place'],
                     y=tournament_data['total_points'],
                     mode='lines+markers',
-                    name=f"{tournament_data.iloc[0]['event_name']} (FSI: {tournament_data.iloc[0]['fsi']:.2f})",
+                    name=f"{first['event_name']} (FSI: {first['fsi']:.2f})",
                     hovertext=hover_text,
                     hoverinfo='text',
                     line=dict(width=2),
@@ -162,8 +168,8 @@ def render():
     # ========== END NEW SECTION ==========
     
     # Get FSI data from database
-    from app import get_cached_tournament_fsi
-    fsi_df = get_cached_tournament_fsi(st.session_state.data_cache_key)
+    from app import get_cached_tournament_fsi, get_db_version
+    fsi_df = get_cached_tournament_fsi(st.session_state.data_cache_key, get_db_version())
     
     if len(fsi_df) == 0:
         st.warning("⚠️ No FSI data available. Please run recalculation from Data Management.")
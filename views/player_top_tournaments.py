@@ -12,6 +12,7 @@ def render():
     from app import (
         get_cached_players_with_points,
         get_cached_all_seasons,
+        get_db_version,
         get_cached_player_tournament_events,
         show_cache_freshness
     )
@@ -40,8 +41,7 @@ def render():
     selected_player = st.selectbox("Select Player", player_names)
     
     # Season filter (cached)
-    seasons_df = get_cached_all_seasons(cache_key)
-    seasons = ["All Seasons"] + seasons_df['season'].tolist()
+    seasons = ["All Seasons", *get_cached_all_seasons(cache_key, get_db_version())]
     selected_season = st.selectbox("Filter by Season", seasons)
     
     # Get player's event points (cached with parameterized query)
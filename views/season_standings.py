@@ -9,8 +9,13 @@ def render():
     st.title("🏆 Season Standings")
     
     # Import cached functions from app.py
-    from app import get_cached_season_standings, get_cached_tournament_groups, show_cache_freshness
-    from db_service import normalize_season
+    from app import (
+        get_cached_season_standings,
+        get_cached_standings_seasons,
+        get_cached_tournament_groups,
+        get_db_version,
+        show_cache_freshness
+    )
     
     # Get cache key from session state
     cache_key = st.session_state.get('data_cache_key', 0)
@@ -25,23 +30,16 @@ def render():
     # Show cache freshness
     show_cache_freshness()
     
-    # Get all standings to extract available seasons (cached via get_cached_season_standings)
-    all_standings_df = get_cached_season_standings(cache_key)
+    # Normalized seasons with standings, newest first (cached)
+    seasons = list(get_cached_standings_seasons(cache_key, get_db_version()))
     
-    if len(all_standings_df) == 0:
+    if not seasons:
         st.warning("⚠️ No season standings available. Please run recalculation from Data Management to generate points.")
         st.info("💡 Upload tournament data and click 'Recalculate All Ratings' to compute season points.")
         return
     
-    # Extract and normalize seasons
-    seasons_raw = all_standings_df['season'].unique().tolist()
-    seasons_normalized = list(set(normalize_season(s) for s in seasons_raw))
-    # Sort numerically (convert to int) so Season 16 comes before Season 9
-    seasons = sorted(seasons_normalized, key=lambda x: int(x), reverse=True)
-    
     # Get tournament groups for filter
-    groups_df = get_cached_tournament_groups(cache_key)
-    tournament_groups = ['All'] + groups_df['tournament_group'].tolist() if len(groups_df) > 0 else ['All']
+    tournament_groups = ['All', *get_cached_tournament_groups(cache_key, get_db_version())]
     
     # Filters row
     col1, col2 = st.columns(2)
@@ -52,7 +50,7 @@ def render():
     
     # Get cached standings for selected season and group
     group_filter = None if selected_group == 'All' else selected_group
-    standings_df = get_cached_season_standings(cache_key, season=selected_season, tournament_group=group_filter)
+    standings_df = get_cached_season_standings(cache_key, get_db_version(), season=selected_season, tournament_group=group_filter)
     
     if len(standings_df) == 0:
         st.warning(f"⚠️ No standings data available for Season {selected_season}")
@@ -61,29 +59,23 @@ def render():
     # Display leaderboard
     st.subheader(f"Season {selected_season} Leaderboard")
     
-    # Format the dataframe for display
-    display_df = standings_df.copy()
-    display_df['total_points'] = display_df['total_points'].round(2)
-    display_df['singles_points'] = display_df['singles_points'].round(2)
-    display_df['doubles_points'] = display_df['doubles_points'].round(2)
-    display_df['final_display_rating'] = display_df['final_display_rating'].round(2)
-    
-    # Rename columns for display
-    display_df = display_df.rename(columns={
-        'rank': 'Rank',
-        'player': 'Player',
-        'singles_points': 'Singles Points',
-        'doubles_points': 'Doubles Points',
-        'total_points': 'Total Points',
-        'events_counted': 'Events',
-        'final_display_rating': 'TrueSkill Rating',
-        'pseudo_elo': 'Pseudo-ELO'
-    })
-    
-    # Reorder columns
-    cols = ['Rank', 'Player', 'Singles Points', 'Doubles Points', 'Total Points', 'Events', 'TrueSkill Rating', 'Pseudo-ELO']
-    display_df = display_df[cols]
-    
+    # Format the dataframe for display: select the shown columns first so only
+    # those are rounded/renamed, instead of copying the whole cached frame
+    display_df = (
+        standings_df[['rank', 'player', 'singles_points', 'doubles_points', 'total_points',
+                      'events_counted', 'final_display_rating', 'pseudo_elo']]
+        .round({'total_points': 2, 'singles_points': 2, 'doubles_points': 2, 'final_display_rating': 2})
+        .rename(columns={
+            'rank': 'Rank',
+            'player': 'Player',
+            'singles_points': 'Singles Points',
+            'doubles_points': 'Doubles Points',
+            'total_points': 'Total Points',
+            'events_counted': 'Events',
+            'final_display_rating': 'TrueSkill Rating',
+            'pseudo_elo': 'Pseudo-ELO'
+        })
+    )
     
     # Color-code top 3
     def highlight_top3(row):